@@ -8,6 +8,7 @@ un numéro de téléphone sur différentes plateformes.
 
 import asyncio
 import sys
+import time
 from phone_checker import PhoneChecker
 from phone_checker.logging import logger
 
@@ -26,13 +27,15 @@ async def example_basic_check():
             
             response = await checker.check_number(phone, country_code)
             
-            print(f"\n📱 Résultats pour +{country_code} {phone}:")
-            print(f"   Plateformes vérifiées: {len(response.results)}")
-            print(f"   Trouvé sur: {len(response.platforms_found)} plateforme(s)")
-            print(f"   Temps total: {response.total_time:.1f}ms")
-            print(f"   Taux de succès: {response.success_rate:.1%}")
-            
-            print("\n📊 Détails par plateforme:")
+            # Accumule la sortie pour l'afficher en une seule écriture
+            lines = [
+                f"\n📱 Résultats pour +{country_code} {phone}:",
+                f"   Plateformes vérifiées: {len(response.results)}",
+                f"   Trouvé sur: {len(response.platforms_found)} plateforme(s)",
+                f"   Temps total: {response.total_time:.1f}ms",
+                f"   Taux de succès: {response.success_rate:.1%}",
+                "\n📊 Détails par plateforme:"
+            ]
             for result in response.results:
                 status = "✅ Trouvé" if result.exists else "❌ Non trouvé"
                 if result.error:
@@ -41,13 +44,15 @@ async def example_basic_check():
                 confidence = f"({result.confidence_score:.1%})" if result.confidence_score > 0 else ""
                 cached = " [Cache]" if result.is_cached else ""
                 
-                print(f"   {result.platform.upper():12} {status} {confidence}{cached}")
+                lines.append(f"   {result.platform.upper():12} {status} {confidence}{cached}")
                 
                 if result.username:
-                    print(f"                 👤 @{result.username}")
+                    lines.append(f"                 👤 @{result.username}")
                     
                 if result.response_time > 0:
-                    print(f"                 ⏱️ {result.response_time:.0f}ms")
+                    lines.append(f"                 ⏱️ {result.response_time:.0f}ms")
+            
+            print("\n".join(lines))
     
     except Exception as e:
         print(f"❌ Erreur: {e}")
@@ -134,19 +139,19 @@ async def example_with_cache():
         async with PhoneChecker() as checker:
             # Première vérification (va en cache)
             print("Première vérification (mise en cache)...")
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             response1 = await checker.check_number(phone, country_code)
-            time1 = (asyncio.get_event_loop().time() - start_time) * 1000
+            time1 = (time.perf_counter() - start_time) * 1000
             
             print(f"   Temps: {time1:.1f}ms")
             
             # Deuxième vérification (depuis le cache)
             print("\nDeuxième vérification (depuis le cache)...")
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             
             response2 = await checker.check_number(phone, country_code)
-            time2 = (asyncio.get_event_loop().time() - start_time) * 1000
+            time2 = (time.perf_counter() - start_time) * 1000
             
             print(f"   Temps: {time2:.1f}ms")
             print(f"   Accélération: {time1/time2:.1f}x plus rapide!")
@@ -212,21 +217,20 @@ async def main():
         example_health_check
     ]
     
-    results = []
+    successful = total = 0
     for example in examples:
         try:
-            result = await example()
-            results.append(result)
+            if await example():
+                successful += 1
+            total += 1
         except KeyboardInterrupt:
             print("\n⏹️ Exemples interrompus par l'utilisateur")
             break
         except Exception as e:
             print(f"❌ Erreur dans l'exemple: {e}")
-            results.append(False)
+            total += 1
     
     # Résumé final
-    successful = sum(results)
-    total = len(results)
     
     print(f"\n✨ Résumé des exemples:")
     print(f"   Réussis: {successful}/{total}")
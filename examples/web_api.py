@@ -17,7 +17,15 @@ except ImportError:
     print("   ou utilisez: pip install 'modern-phone-checker[web]'")
     FASTAPI_AVAILABLE = False
 
+# Sérialisation JSON via orjson (extension C) si disponible
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    DefaultJSONResponse = JSONResponse if FASTAPI_AVAILABLE else None
+
 import asyncio
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
@@ -25,6 +33,8 @@ import logging
 from phone_checker import PhoneChecker
 from phone_checker.models import PhoneCheckResponse
 from phone_checker.logging import logger
+from phone_checker.platforms import get_available_platforms
+from phone_checker.utils import is_plausible_phone_number
 
 # Configuration du logging pour FastAPI
 logging.basicConfig(level=logging.INFO)
@@ -64,34 +74,38 @@ if not FASTAPI_AVAILABLE:
 phone_checker: Optional[PhoneChecker] = None
 app_start_time = datetime.now()
 
-# Application FastAPI
-app = FastAPI(
-    title="Modern Phone Checker API",
-    description="API REST pour la vérification éthique de numéros de téléphone",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialise le PhoneChecker au démarrage de l'application."""
+@asynccontextmanager
+async def lifespan(app: "FastAPI"):
+    """Initialise le PhoneChecker au démarrage et le ferme à l'arrêt."""
     global phone_checker
     logger.info("🚀 Démarrage de l'API Modern Phone Checker")
     
     phone_checker = PhoneChecker()
     await phone_checker.initialize()
     
+    # Données constantes pendant toute la vie du processus
+    app.state.available_platforms = phone_checker.get_available_platforms()
+    app.state.platforms_info = get_available_platforms()
     logger.info("✅ PhoneChecker initialisé avec succès")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Ferme proprement le PhoneChecker à l'arrêt."""
-    global phone_checker
-    if phone_checker:
+    
+    try:
+        yield
+    finally:
         await phone_checker.close()
+        phone_checker = None
         logger.info("👋 PhoneChecker fermé proprement")
 
+# Application FastAPI
+app = FastAPI(
+    title="Modern Phone Checker API",
+    description="API REST pour la vérification éthique de numéros de téléphone",
+    version="0.1.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
+)
+
 @app.get("/", response_model=Dict[str, Any])
 async def root():
     """Point d'entrée racine de l'API."""
@@ -156,40 +170,51 @@ async def check_multiple_numbers(request: MultiplePhoneCheckRequest):
             detail="Trop de numéros (maximum 50 par requête)"
         )
     
+    # Rejette le lot entier si des numéros sont manifestement mal formés
+    invalid_indices = [
+        i for i, num in enumerate(request.numbers)
+        if not is_plausible_phone_number(num.phone)
+    ]
+    if invalid_indices:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Numéros invalides aux positions: {invalid_indices}"
+        )
+    
     try:
         logger.info(f"API: Vérification multiple de {len(request.numbers)} numéros")
         
-        # Conversion des modèles Pydantic en dictionnaires
-        numbers_data = [
-            {
-                "phone": num.phone,
-                "country_code": num.country_code
-            }
-            for num in request.numbers
-        ]
-        
-        responses = await phone_checker.check_multiple_numbers(numbers_data)
+        # Les modèles Pydantic sont passés directement (attributs phone/country_code)
+        responses = await phone_checker.check_multiple_numbers(
+            request.numbers,
+            max_concurrent=request.max_concurrent
+        )
         
         # Traitement des résultats
         results = []
-        for i, response in enumerate(responses):
+        successful_checks = 0
+        failed_checks = 0
+        for num, response in zip(request.numbers, responses):
+            request_data = {"phone": num.phone, "country_code": num.country_code}
             if isinstance(response, Exception):
+                failed_checks += 1
                 results.append({
-                    "request": numbers_data[i],
+                    "request": request_data,
                     "error": str(response),
                     "success": False
                 })
             else:
+                successful_checks += 1
                 results.append({
-                    "request": numbers_data[i],
+                    "request": request_data,
                     "result": response.to_dict(),
                     "success": True
                 })
         
         return {
             "total_requests": len(request.numbers),
-            "successful_checks": sum(1 for r in results if r["success"]),
-            "failed_checks": sum(1 for r in results if not r["success"]),
+            "successful_checks": successful_checks,
+            "failed_checks": failed_checks,
             "results": results
         }
         
@@ -229,14 +254,16 @@ async def get_stats():
         raise HTTPException(status_code=503, detail="Service non disponible")
     
     try:
-        stats = phone_checker.get_stats()
+        # Seuls les compteurs sont lus : la liste des plateformes est
+        # calculée une fois au démarrage
+        stats = phone_checker.stats
         
         return StatsResponse(
             total_checks=stats["total_checks"],
             successful_checks=stats["successful_checks"],
             failed_checks=stats["failed_checks"],
-            cache_hit_rate=stats["cache_hit_rate"],
-            available_platforms=stats["available_platforms"]
+            cache_hit_rate=phone_checker.cache_hit_rate,
+            available_platforms=app.state.available_platforms
         )
         
     except Exception as e:
@@ -251,8 +278,7 @@ async def get_platforms():
     if not phone_checker:
         raise HTTPException(status_code=503, detail="Service non disponible")
     
-    from phone_checker.platforms import get_available_platforms
-    return get_available_platforms()
+    return app.state.platforms_info
 
 @app.delete("/cache")
 async def clear_cache():
@@ -291,7 +317,7 @@ async def get_cache_info():
 async def global_exception_handler(request, exc):
     """Gestionnaire global des exceptions."""
     logger.error(f"Erreur non gérée: {exc}")
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
         content={"detail": "Erreur interne du serveur"}
     )
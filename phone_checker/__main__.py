@@ -1,99 +1,171 @@
 """Interface en ligne de commande avancée avec affichage riche."""
 
 import asyncio
+import csv
 import sys
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.tree import Tree
-from rich.json import JSON
-from rich import box
 from datetime import datetime
 
 from . import PhoneChecker
-from .models import PhoneCheckResponse, VerificationStatus
-from .utils import validate_phone_number, format_phone_number
-from .config import default_config
+from .models import PhoneCheckResult, PhoneCheckResponse, VerificationStatus, encode_json
+from .utils import parse_and_format, clean_phone_number
+from .config import get_default_config
 from .logging import logger
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich.text import Text
+
+# Rich n'est importé qu'au premier affichage pour accélérer le démarrage du CLI
+_console: Optional['Console'] = None
+
+def get_console() -> 'Console':
+    """Retourne la console Rich partagée, créée au premier appel."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        # Mode d'affichage fixé d'emblée plutôt que détecté par Rich
+        _console = Console(
+            force_terminal=sys.stdout.isatty(),
+            highlight=False,
+            markup=True
+        )
+    return _console
+
+def render_json(data) -> 'Text':
+    """Prépare l'affichage coloré d'un document JSON.
+    
+    Équivalent de rich.json.JSON.from_data, mais l'encodage passe par
+    encode_json (orjson si disponible) au lieu du module json.
+    """
+    from rich.highlighter import JSONHighlighter
+    text = JSONHighlighter()(encode_json(data, indent=True).decode('utf-8'))
+    text.no_wrap = True
+    text.overflow = None
+    return text
+
+@lru_cache(maxsize=256)
+def _format_timestamp_parts(year: int, month: int, day: int, hour: int, minute: int, second: int) -> str:
+    """Formate un timestamp à la seconde près (mémoïsé)."""
+    return datetime(year, month, day, hour, minute, second).strftime("%H:%M:%S %d/%m/%Y")
 
 def format_timestamp(timestamp):
     """Formate un timestamp de manière lisible."""
-    return timestamp.strftime("%H:%M:%S %d/%m/%Y")
+    return _format_timestamp_parts(
+        timestamp.year, timestamp.month, timestamp.day,
+        timestamp.hour, timestamp.minute, timestamp.second
+    )
+
+# Nombre de résultats gardés en mémoire par le mode batch pour servir les doublons
+BATCH_MEMO_SIZE = 10_000
+
+def iter_batch_numbers(f: IO[str], is_csv: bool, country: str) -> Iterator[Dict[str, str]]:
+    """Lit les numéros d'un fichier de lot, ligne par ligne.
+    
+    Args:
+        f: Fichier texte ouvert (CSV avec colonnes phone/country_code, ou un numéro par ligne)
+        is_csv: True si le fichier est au format CSV
+        country: Indicatif pays utilisé quand le fichier n'en précise pas
+        
+    Returns:
+        Itérateur de dictionnaires {'phone': ..., 'country_code': ...}
+    """
+    if is_csv:
+        for row in csv.DictReader(f):
+            phone_num = (row.get('phone') or '').strip()
+            if phone_num:
+                country_code = (row.get('country_code') or country).strip()
+                yield {'phone': phone_num, 'country_code': country_code}
+    else:
+        # Fichier texte simple
+        for line in f:
+            phone_num = line.strip()
+            if phone_num:
+                yield {'phone': phone_num, 'country_code': country}
+
+# Emoji affiché pour chaque statut de vérification
+_STATUS_EMOJI = {
+    VerificationStatus.EXISTS: "✅",
+    VerificationStatus.NOT_EXISTS: "❌",
+    VerificationStatus.ERROR: "❌",
+    VerificationStatus.TIMEOUT: "⏰",
+    VerificationStatus.RATE_LIMITED: "🚫"
+}
 
 def get_status_emoji(status: VerificationStatus, exists: bool) -> str:
     """Retourne l'emoji approprié pour un statut."""
-    if status == VerificationStatus.EXISTS:
-        return "✅"
-    elif status == VerificationStatus.NOT_EXISTS:
-        return "❌"
-    elif status == VerificationStatus.ERROR:
-        return "❌"
-    elif status == VerificationStatus.TIMEOUT:
-        return "⏰"
-    elif status == VerificationStatus.RATE_LIMITED:
-        return "🚫"
-    else:
-        return "❓"
+    return _STATUS_EMOJI.get(status, "❓")
 
-def create_result_table(response: PhoneCheckResponse) -> Table:
-    """Crée un tableau rich pour afficher les résultats."""
+# Schéma constant des colonnes du tableau de résultats
+RESULT_TABLE_COLUMNS = (
+    ("Plateforme", {"style": "cyan bold", "width": 12}),
+    ("Statut", {"style": "green bold", "width": 15}),
+    ("Détails", {"style": "yellow", "min_width": 20}),
+    ("Confiance", {"style": "blue", "width": 10}),
+    ("Temps", {"style": "magenta", "width": 12}),
+)
+
+def new_result_table() -> 'Table':
+    """Crée un tableau vide avec les colonnes de résultats."""
+    from rich.table import Table
+    from rich import box
+    
     table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
-    table.add_column("Plateforme", style="cyan bold", width=12)
-    table.add_column("Statut", style="green bold", width=15)
-    table.add_column("Détails", style="yellow", min_width=20)
-    table.add_column("Confiance", style="blue", width=10)
-    table.add_column("Temps", style="magenta", width=12)
+    for header, options in RESULT_TABLE_COLUMNS:
+        table.add_column(header, **options)
+    return table
+
+def _status_cell(result: PhoneCheckResult) -> str:
+    """Cellule de statut : emoji suivi du libellé coloré."""
+    if result.error:
+        return "❌ [red]Erreur[/red]"
+    if result.exists:
+        return get_status_emoji(result.status, True) + " [green]Trouvé[/green]"
+    return get_status_emoji(result.status, False) + " [red]Non trouvé[/red]"
+
+def _details_cell(result: PhoneCheckResult) -> str:
+    """Cellule de détails : une ligne par information disponible."""
+    metadata = result.metadata
+    details = "\n".join(filter(None, (
+        result.error and f"[red]Erreur:[/red] {result.error[:50]}...",
+        result.username and f"[blue]@{result.username}[/blue]",
+        result.is_cached and f"[dim]Cache ({metadata.get('freshness_score', 0):.1%})[/dim]",
+        metadata.get('method') and f"[dim]{metadata['method']}[/dim]"
+    )))
+    return details or "-"
+
+def create_result_table(response: PhoneCheckResponse) -> 'Table':
+    """Crée un tableau rich pour afficher les résultats."""
+    table = new_result_table()
     
-    for result in response.results:
-        # Status avec emoji
-        status_text = get_status_emoji(result.status, result.exists)
-        if result.exists:
-            status_text += " [green]Trouvé[/green]"
-        else:
-            status_text += " [red]Non trouvé[/red]"
-        
-        if result.error:
-            status_text = "❌ [red]Erreur[/red]"
-        
-        # Détails
-        details = []
-        if result.error:
-            details.append(f"[red]Erreur:[/red] {result.error[:50]}...")
-        if result.username:
-            details.append(f"[blue]@{result.username}[/blue]")
-        if result.is_cached:
-            freshness = result.metadata.get('freshness_score', 0)
-            details.append(f"[dim]Cache ({freshness:.1%})[/dim]")
-        if result.metadata.get('method'):
-            details.append(f"[dim]{result.metadata['method']}[/dim]")
-        
-        details_text = "\n".join(details) if details else "-"
-        
-        # Score de confiance
-        confidence = f"{result.confidence_score:.1%}" if result.confidence_score > 0 else "-"
-        
-        # Temps de réponse
-        time_text = f"{result.response_time:.0f}ms" if result.response_time > 0 else "-"
-        
-        table.add_row(
+    # Toutes les cellules sont calculées avant de remplir le tableau
+    rows = [
+        (
             result.platform.upper(),
-            status_text,
-            details_text,
-            confidence,
-            time_text
+            _status_cell(result),
+            _details_cell(result),
+            f"{result.confidence_score:.1%}" if result.confidence_score > 0 else "-",
+            f"{result.response_time:.0f}ms" if result.response_time > 0 else "-"
         )
+        for result in response.results
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     return table
 
-def create_summary_panel(response: PhoneCheckResponse) -> Panel:
+def create_summary_panel(response: PhoneCheckResponse) -> 'Panel':
     """Crée un panneau de résumé."""
+    from rich.panel import Panel
+    
     found_count = len(response.platforms_found)
     not_found_count = len(response.platforms_not_found)
     error_count = len(response.platforms_error)
@@ -135,9 +207,9 @@ def cli(ctx, config, verbose, quiet):
     
     # Configure le niveau de log
     if verbose:
-        default_config.logging.level = 'DEBUG'
+        get_default_config().logging.level = 'DEBUG'
     elif quiet:
-        default_config.logging.level = 'ERROR'
+        get_default_config().logging.level = 'ERROR'
 
 @cli.command()
 @click.argument('phone')
@@ -150,9 +222,13 @@ def cli(ctx, config, verbose, quiet):
 def check(ctx, phone: str, country: str, platforms: tuple, force_refresh: bool, json_output: bool, no_cache: bool):
     """Vérifie un numéro de téléphone sur différentes plateformes."""
     async def run():
-        # Validation du numéro
-        if not validate_phone_number(phone, country):
+        console = get_console()
+        
+        # Validation et formatage du numéro (un seul parsing)
+        valid, formatted_number = parse_and_format(phone, country)
+        if not valid:
             if not ctx.obj['quiet']:
+                from rich.panel import Panel
                 console.print(Panel(
                     f"[red]Format de numéro invalide![/red]\n\n"
                     f"Le numéro {phone} ne semble pas valide pour le pays +{country}.\n"
@@ -162,43 +238,33 @@ def check(ctx, phone: str, country: str, platforms: tuple, force_refresh: bool,
                 ))
             sys.exit(1)
         
-        # Formate le numéro pour l'affichage
-        formatted_number = format_phone_number(phone, country, 'international')
-        if not formatted_number:
-            formatted_number = f"+{country} {phone}"
-        
         # Configuration du checker
         platforms_list = list(platforms) if platforms else None
         
         try:
             async with PhoneChecker(
                 platforms=platforms_list,
-                use_cache=not no_cache
+                use_cache=not no_cache,
+                warmup_connections=True
             ) as checker:
                 
+                # Une seule vérification : un spinner sur une ligne suffit
                 if not ctx.obj['quiet'] and not json_output:
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        TimeElapsedColumn(),
-                        console=console
-                    ) as progress:
-                        task = progress.add_task(
-                            f"Vérification de {formatted_number}...", 
-                            total=None
-                        )
-                        
-                        response = await checker.check_number(
-                            phone, country, platforms_list, force_refresh
-                        )
+                    status = console.status(
+                        f"[cyan]Vérification de {formatted_number}...[/cyan]",
+                        spinner='dots'
+                    )
                 else:
+                    status = nullcontext()
+                
+                with status:
                     response = await checker.check_number(
                         phone, country, platforms_list, force_refresh
                     )
                 
                 # Affichage des résultats
                 if json_output:
-                    console.print(JSON.from_data(response.to_dict()))
+                    console.print(render_json(response.to_dict()))
                 else:
                     if not ctx.obj['quiet']:
                         console.print("\n")
@@ -228,86 +294,129 @@ def check(ctx, phone: str, country: str, platforms: tuple, force_refresh: bool,
 @cli.command()
 @click.argument('file', type=click.Path(exists=True))
 @click.option('--country', '-c', default='33', help='Code pays par défaut')
-@click.option('--output', '-o', help='Fichier de sortie JSON')
+@click.option('--output', '-o', help='Fichier de sortie JSON (.jsonl pour une écriture au fil de l\'eau)')
 @click.option('--platforms', '-p', multiple=True, help='Plateformes à vérifier')
 @click.option('--concurrent', default=5, help='Nombre de vérifications simultanées')
 @click.pass_context
 def batch(ctx, file: str, country: str, output: str, platforms: tuple, concurrent: int):
-    """Vérifie plusieurs numéros depuis un fichier."""
+    """Vérifie plusieurs numéros depuis un fichier.
+    
+    Le fichier est lu au fil de l'eau : seuls quelques numéros sont en attente
+    à un instant donné. Avec une sortie .jsonl, chaque résultat est écrit dès
+    qu'il est disponible (une ligne JSON par numéro).
+    """
     async def run():
-        import csv
-        import json
+        from rich.progress import Progress
         
-        numbers = []
+        console = get_console()
         
-        # Lecture du fichier
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                if file.endswith('.csv'):
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        phone_num = row.get('phone', '').strip()
-                        country_code = row.get('country_code', country).strip()
-                        if phone_num:
-                            numbers.append({'phone': phone_num, 'country_code': country_code})
-                else:
-                    # Fichier texte simple
-                    for line in f:
-                        phone_num = line.strip()
-                        if phone_num:
-                            numbers.append({'phone': phone_num, 'country_code': country})
-        
-        except Exception as e:
+            # Tampon de lecture de 1 Mo : peu d'appels système sur les gros fichiers
+            f = open(file, 'r', encoding='utf-8', buffering=1 << 20)
+        except OSError as e:
             console.print(f"[red]Erreur lors de la lecture du fichier:[/red] {e}")
             sys.exit(1)
         
-        console.print(f"[cyan]Traitement de {len(numbers)} numéros...[/cyan]")
-        
         platforms_list = list(platforms) if platforms else None
-        results = []
+        stream_output = output is not None and output.endswith('.jsonl')
+        results: List[dict] = []
+        total_numbers = 0
+        successful_checks = 0
+        duplicate_rows = 0
+        read_error: Optional[Exception] = None
+        # Derniers résultats par (numéro nettoyé, indicatif), du plus ancien au plus récent
+        recent_results: 'OrderedDict[Tuple[str, str], dict]' = OrderedDict()
         
-        async with PhoneChecker(platforms=platforms_list) as checker:
-            # Limite la concurrence
-            semaphore = asyncio.Semaphore(concurrent)
-            
-            async def check_number(number_info):
-                async with semaphore:
-                    try:
-                        return await checker.check_number(
-                            number_info['phone'], 
-                            number_info['country_code'],
-                            platforms_list
-                        )
-                    except Exception as e:
-                        logger.error(f"Erreur pour {number_info}: {e}")
-                        return None
-            
-            # Progress bar pour le traitement par lots
-            with Progress(console=console) as progress:
-                task = progress.add_task("Vérification...", total=len(numbers))
-                
-                tasks = [check_number(num_info) for num_info in numbers]
+        console.print("[cyan]Traitement des numéros...[/cyan]")
+        
+        with f, (open(output, 'wb') if stream_output else nullcontext()) as out:
+            async with PhoneChecker(platforms=platforms_list, warmup_connections=True) as checker:
+                # File bornée entre la lecture du fichier et les workers
+                pending: asyncio.Queue = asyncio.Queue(maxsize=concurrent * 2)
                 
-                for coro in asyncio.as_completed(tasks):
-                    result = await coro
-                    if result:
-                        results.append(result)
-                    progress.advance(task)
+                with Progress(console=console) as progress:
+                    task = progress.add_task("Vérification...", total=None)
+                    
+                    async def produce():
+                        nonlocal total_numbers, read_error
+                        try:
+                            for number_info in iter_batch_numbers(f, file.endswith('.csv'), country):
+                                await pending.put(number_info)
+                                total_numbers += 1
+                                progress.update(task, total=total_numbers)
+                        except Exception as e:
+                            read_error = e
+                        finally:
+                            # Un marqueur de fin par worker
+                            for _ in range(concurrent):
+                                await pending.put(None)
+                    
+                    async def work():
+                        nonlocal successful_checks, duplicate_rows
+                        while True:
+                            number_info = await pending.get()
+                            if number_info is None:
+                                return
+                            
+                            # Les doublons du fichier réutilisent le résultat déjà calculé
+                            key = (clean_phone_number(number_info['phone']), number_info['country_code'])
+                            record = recent_results.get(key)
+                            if record is not None:
+                                recent_results.move_to_end(key)
+                                duplicate_rows += 1
+                            else:
+                                try:
+                                    response = await checker.check_number(
+                                        number_info['phone'],
+                                        number_info['country_code'],
+                                        platforms_list
+                                    )
+                                except Exception as e:
+                                    logger.error(f"Erreur pour {number_info}: {e}")
+                                    progress.advance(task)
+                                    continue
+                                record = response.to_dict()
+                                recent_results[key] = record
+                                if len(recent_results) > BATCH_MEMO_SIZE:
+                                    recent_results.popitem(last=False)
+                            
+                            successful_checks += 1
+                            if stream_output:
+                                out.write(encode_json(record) + b'\n')
+                            else:
+                                results.append(record)
+                            progress.advance(task)
+                    
+                    await asyncio.gather(produce(), *(work() for _ in range(concurrent)))
+        
+        if read_error is not None:
+            console.print(f"[red]Erreur lors de la lecture du fichier:[/red] {read_error}")
+            sys.exit(1)
+        
+        if duplicate_rows:
+            console.print(f"[cyan]{duplicate_rows} doublons servis sans nouvelle vérification[/cyan]")
+        
+        if stream_output:
+            console.print(
+                f"[green]{successful_checks}/{total_numbers} résultats écrits dans {output}[/green]"
+            )
+            return
         
         # Sauvegarde des résultats
         output_data = {
             'processed_at': datetime.now().isoformat(),
-            'total_numbers': len(numbers),
-            'successful_checks': len(results),
-            'results': [r.to_dict() for r in results]
+            'total_numbers': total_numbers,
+            'successful_checks': successful_checks,
+            'duplicate_rows': duplicate_rows,
+            'results': results
         }
         
         if output:
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            with open(output, 'wb') as out_file:
+                out_file.write(encode_json(output_data, indent=True))
             console.print(f"[green]Résultats sauvegardés dans {output}[/green]")
         else:
-            console.print(JSON.from_data(output_data))
+            console.print(render_json(output_data))
     
     asyncio.run(run())
 
@@ -316,6 +425,11 @@ def batch(ctx, file: str, country: str, output: str, platforms: tuple, concurren
 def stats(ctx):
     """Affiche les statistiques du cache et de l'application."""
     async def run():
+        from rich.panel import Panel
+        from rich.tree import Tree
+        
+        console = get_console()
+        
         async with PhoneChecker() as checker:
             # Statistiques du checker
             checker_stats = checker.get_stats()
@@ -378,6 +492,8 @@ def stats(ctx):
 def clear_cache(ctx, confirm):
     """Vide le cache complètement."""
     async def run():
+        console = get_console()
+        
         if not confirm:
             if not click.confirm("Êtes-vous sûr de vouloir vider le cache ?"):
                 console.print("[yellow]Opération annulée.[/yellow]")
@@ -397,6 +513,9 @@ def clear_cache(ctx, confirm):
 @click.pass_context
 def config_show(ctx):
     """Affiche la configuration actuelle."""
+    from rich.panel import Panel
+    
+    default_config = get_default_config()
     config_data = {
         'cache': {
             'enabled': default_config.cache.enabled,
@@ -420,21 +539,30 @@ def config_show(ctx):
             'timeout': config.timeout
         }
     
-    console.print(Panel(
-        JSON.from_data(config_data),
+    get_console().print(Panel(
+        render_json(config_data),
         title="⚙️ Configuration actuelle",
         border_style="cyan"
     ))
 
+def _install_event_loop():
+    """Utilise la boucle d'événements uvloop si elle est installée."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
 def main():
     """Point d'entrée principal."""
+    _install_event_loop()
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Opération interrompue par l'utilisateur.[/yellow]")
+        get_console().print("\n[yellow]Opération interrompue par l'utilisateur.[/yellow]")
         sys.exit(130)
     except Exception as e:
-        console.print(f"[red]Erreur fatale:[/red] {e}")
+        get_console().print(f"[red]Erreur fatale:[/red] {e}")
         sys.exit(1)
 
 if __name__ == '__main__':
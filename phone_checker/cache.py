@@ -3,21 +3,138 @@
 Ce module permet de stocker temporairement les résultats des vérifications
 pour éviter de faire trop de requêtes aux APIs. Il utilise un système de
 score de fraîcheur et de gestion de la taille du cache.
+
+Les entrées sont persistées dans un journal unique en ajout seul
+(``cache.log``) : chaque écriture ajoute un enregistrement, chaque
+suppression un enregistrement vide, et le journal est compacté lorsque
+les enregistrements obsolètes dominent. Les données volumineuses sont
+compressées avec zlib sur disque. Le chargement se fait en une
+seule lecture séquentielle : chaque enregistrement porte en clair sa clé
+et sa date, et les données JSON ne sont décodées qu'au premier accès.
+
+Les écritures sont différées : ``set`` ne met à jour que la mémoire et
+marque l'entrée comme modifiée, puis une tâche de fond ajoute toutes les
+modifications en attente au journal en une seule écriture. ``flush`` et
+``close`` forcent l'écriture.
+
+Plusieurs processus (par exemple des invocations CLI simultanées) peuvent
+partager le même répertoire : chaque accès au journal est protégé par un
+verrou ``flock`` sur ``cache.lock`` (systèmes POSIX uniquement).
 """
 
 import os
 import json
+import zlib
+import time
+import struct
 import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterator
 from pathlib import Path
-import aiofiles
-import aiofiles.os
 from .models import PhoneCheckResult
 from .logging import get_logger
 
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None
+
 logger = get_logger('cache')
 
+# Nom du journal dans le répertoire de cache
+LOG_FILENAME = 'cache.log'
+
+# Fichier servant de verrou inter-processus sur le journal
+LOCK_FILENAME = 'cache.lock'
+
+# En-tête d'un enregistrement : longueur du payload (uint32 LE) et drapeaux (uint8)
+_RECORD_HEADER = struct.Struct('<IB')
+
+# Drapeau d'un enregistrement dont les données sont compressées avec zlib
+_FLAG_ZLIB = 0x01
+
+# Drapeau d'un enregistrement indexé : clé, date et taille des données en
+# clair devant les données (porté par tous les enregistrements)
+_FLAG_INDEXED = 0x02
+
+# Index d'un enregistrement : longueur de la clé (uint16), date de mise en
+# cache (float64) et taille des données non compressées (uint32, 0 pour une
+# suppression)
+_INDEX_HEADER = struct.Struct('<HdI')
+
+# Taille minimale d'un payload avant compression, et niveau de compression
+_COMPRESS_MIN_BYTES = 256
+_COMPRESS_LEVEL = 6
+
+# Taille minimale du journal avant d'envisager une compaction
+_COMPACTION_MIN_BYTES = 64 * 1024
+
+# Délai maximal (secondes) avant l'écriture des modifications en attente
+_FLUSH_INTERVAL = 0.25
+
+# Nombre de modifications en attente déclenchant une écriture immédiate
+_FLUSH_MAX_PENDING = 64
+
+# Nombre de verrous par clé (puissance de 2)
+_LOCK_STRIPES = 64
+
+# Unités d'affichage des tailles et facteur correspondant (puissances de 1024)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SIZE_SCALES = tuple(1024 ** i for i in range(len(_SIZE_UNITS)))
+
+class CacheEntry:
+    """Entrée du cache en mémoire.
+    
+    Les champs lus par les parcours (expiration, informations) sont des
+    attributs à slots, sans passer par le dictionnaire de données. Une
+    entrée rechargée depuis le journal garde ses octets bruts et n'est
+    décodée qu'au premier accès à ``data``.
+    
+    Attributes:
+        size: Taille en octets des données sérialisées (avant compression)
+        timestamp: Date de mise en cache en secondes epoch
+        blob: Données encodées telles que lues dans le journal, None une fois décodées
+        compressed: Si blob est compressé avec zlib
+    """
+    __slots__ = ('size', 'timestamp', 'blob', 'compressed', '_data')
+    
+    def __init__(
+        self,
+        size: int,
+        timestamp: float,
+        data: Optional[Dict[str, Any]] = None,
+        blob: Optional[bytes] = None,
+        compressed: bool = False
+    ):
+        self.size = size
+        self.timestamp = timestamp
+        self.blob = blob
+        self.compressed = compressed
+        self._data = data
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Données de l'entrée (timestamp, results, phone, country_code).
+        
+        Raises:
+            ValueError: Si les octets lus dans le journal sont invalides
+        """
+        if self._data is None:
+            try:
+                raw = zlib.decompress(self.blob) if self.compressed else self.blob
+            except zlib.error as e:
+                raise ValueError(f"Données compressées invalides: {e}") from e
+            data = json.loads(raw)
+            if not isinstance(data, dict) or 'results' not in data:
+                raise ValueError("Structure de données de cache invalide")
+            self._data = data
+            self.blob = None
+        return self._data
+
 class CacheManager:
     """Gestionnaire de cache intelligent avec gestion de la taille et de la fraîcheur."""
     
@@ -37,8 +154,23 @@ class CacheManager:
         self.cache_dir = Path(cache_dir)
         self.expire_after = expire_after
         self.max_size_mb = max_size_mb
-        self.cache_data: Dict[str, Any] = {}
-        self._lock = asyncio.Lock()
+        # Entrées dans l'ordre d'utilisation (la moins récemment utilisée en tête)
+        self.cache_data: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Verrous répartis par clé : des numéros différents ne s'attendent pas.
+        # Les structures partagées (ordre LRU, statistiques) ne sont modifiées
+        # qu'entre deux points de suspension, sans verrou supplémentaire.
+        self._key_locks = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+        
+        # Taille et nombre d'enregistrements du journal (obsolètes inclus)
+        self._log_bytes = 0
+        self._log_records = 0
+        
+        # Couples (date, données encodées) en attente d'écriture, par clé
+        # (le dernier l'emporte ; données vides pour une suppression)
+        self._dirty: Dict[str, Tuple[float, bytes]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
         
         # Statistiques du cache
         self.stats = {
@@ -59,63 +191,369 @@ class CacheManager:
     async def _ensure_cache_dir(self):
         """Crée le répertoire de cache s'il n'existe pas."""
         if not self.cache_dir.exists():
-            await aiofiles.os.makedirs(str(self.cache_dir))
+            await self._run_blocking(os.makedirs, str(self.cache_dir), 0o777, True)
             logger.debug(f"Répertoire de cache créé: {self.cache_dir}")
     
-    def _get_cache_file(self, phone: str, country_code: str) -> Path:
-        """Génère le chemin du fichier de cache pour un numéro."""
-        cache_key = f"{country_code}_{phone}"
-        return self.cache_dir / f"{cache_key}.json"
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Exécute une opération fichier bloquante dans le pool de threads par défaut.
+        
+        Un seul saut de thread par opération, chaque opération étant un appel
+        système unique (lecture, ajout, suppression).
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
+    @property
+    def log_path(self) -> Path:
+        """Chemin du journal du cache."""
+        return self.cache_dir / LOG_FILENAME
+    
+    @contextmanager
+    def _log_lock(self, exclusive: bool = True) -> Iterator[None]:
+        """Verrou ``flock`` inter-processus sur le journal (appel bloquant).
+        
+        Args:
+            exclusive: Verrou exclusif (écriture) ou partagé (lecture)
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self.cache_dir / LOCK_FILENAME, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
     
     def _get_cache_key(self, phone: str, country_code: str) -> str:
         """Génère une clé de cache unique."""
         return f"{country_code}_{phone}"
     
+    def _lock_for(self, cache_key: str) -> asyncio.Lock:
+        """Retourne le verrou associé à une clé de cache."""
+        return self._key_locks[hash(cache_key) & (_LOCK_STRIPES - 1)]
+    
     async def _load_cache(self):
-        """Charge les données de cache existantes."""
+        """Charge les données de cache existantes depuis le journal.
+        
+        Toutes les lectures bloquantes (journal et anciens fichiers) sont
+        faites en un seul passage dans un thread, puis rejouées en mémoire.
+        """
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            logger.debug(f"Chargement de {len(cache_files)} fichiers de cache")
-            
-            for cache_file in cache_files:
-                try:
-                    async with aiofiles.open(cache_file, mode='r', encoding='utf-8') as f:
-                        content = await f.read()
-                        data = json.loads(content)
-                        
-                        # Vérifie la structure des données
-                        if self._validate_cache_data(data):
-                            self.cache_data[cache_file.stem] = data
-                            self.stats['size_bytes'] += len(content.encode('utf-8'))
-                        else:
-                            logger.warning(f"Fichier de cache invalide: {cache_file}")
-                            # Supprime le fichier invalide
-                            await aiofiles.os.remove(str(cache_file))
-                            
-                except Exception as e:
-                    logger.error(f"Erreur lors du chargement de {cache_file}: {e}")
-                    try:
-                        await aiofiles.os.remove(str(cache_file))
-                    except:
-                        pass
+            content, legacy_files = await self._run_blocking(self._read_cache_files)
             
+            if content:
+                self._replay_log(content)
+            if legacy_files:
+                await self._import_legacy_files(legacy_files)
             self.stats['entries_count'] = len(self.cache_data)
             
         except Exception as e:
             logger.error(f"Erreur lors du chargement du cache: {e}")
     
+    def _read_cache_files(self) -> Tuple[bytes, List[Tuple[Path, str]]]:
+        """Lit le journal et les anciens fichiers ``*.json`` (appel bloquant).
+        
+        Returns:
+            Contenu du journal et liste de couples (chemin, contenu) des anciens fichiers
+        """
+        with self._log_lock(exclusive=False):
+            content = self.log_path.read_bytes() if self.log_path.exists() else b''
+        
+        legacy_files = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                legacy_files.append((cache_file, cache_file.read_text(encoding='utf-8')))
+            except OSError as e:
+                logger.error(f"Erreur lors de la lecture de {cache_file}: {e}")
+        
+        return content, legacy_files
+    
+    def _iter_records(self, content: bytes) -> Iterator[Tuple[int, int, str, Optional[CacheEntry]]]:
+        """Parcourt les enregistrements valides d'un contenu de journal.
+        
+        Les enregistrements invalides sont ignorés ; un enregistrement tronqué
+        (écriture interrompue) arrête le parcours.
+        
+        Yields:
+            Quadruplets (début, fin, clé de cache, entrée ou None pour une suppression)
+        """
+        offset = 0
+        total = len(content)
+        
+        while offset + _RECORD_HEADER.size <= total:
+            length, flags = _RECORD_HEADER.unpack_from(content, offset)
+            start = offset + _RECORD_HEADER.size
+            end = start + length
+            if end > total:
+                break
+            
+            try:
+                if not flags & _FLAG_INDEXED:
+                    raise ValueError(f"format d'enregistrement inconnu ({flags:#x})")
+                cache_key, entry = self._read_indexed_record(content, start, end, flags)
+            except (ValueError, KeyError, TypeError, struct.error, zlib.error) as e:
+                logger.warning(f"Enregistrement de cache invalide ignoré: {e}")
+            else:
+                yield offset, end, cache_key, entry
+            offset = end
+        
+        if offset < total:
+            logger.warning(f"Journal de cache tronqué: {total - offset} octets ignorés")
+    
+    def _replay_log(self, content: bytes):
+        """Rejoue les enregistrements du journal pour reconstruire l'état en mémoire."""
+        log_end = 0
+        records_count = 0
+        
+        for _, log_end, cache_key, entry in self._iter_records(content):
+            records_count += 1
+            
+            old_entry = self.cache_data.pop(cache_key, None)
+            if old_entry is not None:
+                self.stats['size_bytes'] -= old_entry.size
+            
+            if entry is not None:
+                self.cache_data[cache_key] = entry
+                self.stats['size_bytes'] += entry.size
+        
+        self._log_bytes = log_end
+        self._log_records = records_count
+    
+    def _read_indexed_record(
+        self,
+        content: bytes,
+        start: int,
+        end: int,
+        flags: int
+    ) -> Tuple[str, Optional[CacheEntry]]:
+        """Lit la clé et la date d'un enregistrement indexé, sans décoder ses données.
+        
+        Returns:
+            Clé de cache et entrée non décodée (None pour une suppression)
+        """
+        key_length, timestamp, size = _INDEX_HEADER.unpack_from(content, start)
+        key_start = start + _INDEX_HEADER.size
+        cache_key = content[key_start:key_start + key_length].decode('utf-8')
+        
+        if size == 0:
+            return cache_key, None
+        
+        blob = content[key_start + key_length:end]
+        return cache_key, CacheEntry(size, timestamp, blob=blob, compressed=bool(flags & _FLAG_ZLIB))
+    
+    async def _import_legacy_files(self, legacy_files: List[Tuple[Path, str]]):
+        """Importe les anciens fichiers de cache ``*.json`` dans le journal.
+        
+        Args:
+            legacy_files: Couples (chemin, contenu) lus par _read_cache_files
+        """
+        logger.debug(f"Migration de {len(legacy_files)} fichiers de cache vers le journal")
+        records = []
+        for cache_file, text in legacy_files:
+            try:
+                data = json.loads(text)
+                
+                if self._validate_cache_data(data) and cache_file.stem not in self.cache_data:
+                    payload = self._encode_data(data)
+                    entry = CacheEntry(len(payload), data['timestamp'], data=data)
+                    self.cache_data[cache_file.stem] = entry
+                    self.stats['size_bytes'] += entry.size
+                    records.append(self._pack_record(cache_file.stem, entry.timestamp, payload))
+                    
+            except Exception as e:
+                logger.error(f"Erreur lors du chargement de {cache_file}: {e}")
+        
+        if records:
+            await self._append_records(records)
+        
+        for cache_file, _ in legacy_files:
+            try:
+                await self._run_blocking(os.remove, cache_file)
+            except Exception:
+                pass
+    
+    def _encode_data(self, data: Dict[str, Any]) -> bytes:
+        """Sérialise les données d'une entrée en JSON compact."""
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    def _pack_record(self, cache_key: str, timestamp: float, payload: bytes) -> bytes:
+        """Encode un enregistrement indexé, en compressant les données volumineuses.
+        
+        Args:
+            cache_key: Clé de cache
+            timestamp: Date de mise en cache en secondes epoch
+            payload: Données sérialisées (vides pour une suppression)
+        """
+        if len(payload) >= _COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(payload, _COMPRESS_LEVEL)
+            if len(compressed) < len(payload):
+                return self._frame_record(cache_key, timestamp, len(payload), compressed, _FLAG_ZLIB)
+        return self._frame_record(cache_key, timestamp, len(payload), payload, 0)
+    
+    def _frame_record(
+        self,
+        cache_key: str,
+        timestamp: float,
+        size: int,
+        body: bytes,
+        flags: int
+    ) -> bytes:
+        """Préfixe des données déjà encodées de l'index et de l'en-tête d'enregistrement."""
+        key_bytes = cache_key.encode('utf-8')
+        index = _INDEX_HEADER.pack(len(key_bytes), timestamp, size)
+        length = len(index) + len(key_bytes) + len(body)
+        return _RECORD_HEADER.pack(length, flags | _FLAG_INDEXED) + index + key_bytes + body
+    
+    async def _append_records(self, records: List[bytes]):
+        """Ajoute des enregistrements à la fin du journal."""
+        blob = b''.join(records)
+        await self._run_blocking(self._write_log, blob, 'ab')
+        self._log_bytes += len(blob)
+        self._log_records += len(records)
+    
+    def _write_log(self, blob: bytes, mode: str):
+        """Écrit un bloc dans le journal en un seul appel (appel bloquant)."""
+        with self._log_lock(), open(self.log_path, mode) as f:
+            f.write(blob)
+    
+    def _rewrite_log(self) -> Tuple[int, int, int]:
+        """Compacte le journal sur disque en ne gardant que les entrées vivantes (appel bloquant).
+        
+        Le journal est relu sous verrou exclusif : les enregistrements ajoutés
+        par d'autres processus sont conservés au même titre que les nôtres.
+        
+        Returns:
+            Taille avant compaction, taille après compaction et nombre d'enregistrements gardés
+        """
+        with self._log_lock():
+            try:
+                content = self.log_path.read_bytes()
+            except FileNotFoundError:
+                return 0, 0, 0
+            
+            # Dernier enregistrement de chaque clé, dans l'ordre d'écriture
+            live: Dict[str, bytes] = {}
+            for start, end, cache_key, entry in self._iter_records(content):
+                live.pop(cache_key, None)
+                if entry is not None:
+                    live[cache_key] = content[start:end]
+            
+            blob = b''.join(live.values())
+            tmp_path = self.log_path.with_suffix('.tmp')
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, self.log_path)
+            return len(content), len(blob), len(live)
+    
+    def _remove_log(self):
+        """Supprime le journal (appel bloquant)."""
+        with self._log_lock():
+            if self.log_path.exists():
+                os.remove(self.log_path)
+    
+    def _mark_dirty(self, cache_key: str, timestamp: float, payload: bytes = b''):
+        """Met des données en attente et planifie leur écriture en arrière-plan.
+        
+        La compression est faite au moment de l'écriture, pas dans ``set``.
+        
+        Args:
+            cache_key: Clé de cache
+            timestamp: Date de mise en cache en secondes epoch
+            payload: Données sérialisées (vides pour une suppression)
+        """
+        self._dirty[cache_key] = (timestamp, payload)
+        
+        if len(self._dirty) >= _FLUSH_MAX_PENDING:
+            self._flush_wakeup.set()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.ensure_future(self._flush_later())
+    
+    async def _flush_later(self):
+        """Attend le délai d'écriture (ou un réveil anticipé) puis écrit le journal."""
+        try:
+            await asyncio.wait_for(self._flush_wakeup.wait(), _FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        self._flush_wakeup.clear()
+        await self.flush()
+    
+    async def flush(self):
+        """Écrit dans le journal toutes les modifications en attente."""
+        async with self._flush_lock:
+            if self._dirty:
+                pending, self._dirty = self._dirty, {}
+                try:
+                    await self._append_records([
+                        self._pack_record(cache_key, timestamp, payload)
+                        for cache_key, (timestamp, payload) in pending.items()
+                    ])
+                except Exception as e:
+                    # Les enregistrements plus récents éventuels restent prioritaires
+                    for cache_key, pending_record in pending.items():
+                        self._dirty.setdefault(cache_key, pending_record)
+                    logger.error(f"Erreur lors de l'écriture du journal de cache: {e}")
+                    return
+            
+            if self._needs_compaction():
+                await self._compact_log()
+    
+    async def close(self):
+        """Écrit les modifications en attente et arrête la tâche d'écriture."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            self._flush_wakeup.set()
+            await self._flusher_task
+        await self.flush()
+    
+    def _needs_compaction(self) -> bool:
+        """Indique si les enregistrements obsolètes sont majoritaires dans le journal."""
+        return (
+            self._log_bytes > _COMPACTION_MIN_BYTES
+            and self._log_records > 2 * len(self.cache_data)
+        )
+    
+    async def _compact_log(self):
+        """Réécrit le journal avec uniquement les entrées vivantes.
+        
+        La compaction filtre le journal sur disque plutôt que de sérialiser
+        l'état en mémoire, pour ne pas perdre les écritures d'autres processus.
+        """
+        old_size, new_size, records = await self._run_blocking(self._rewrite_log)
+        logger.debug(
+            f"Journal compacté: {self._format_size(old_size)} -> {self._format_size(new_size)}"
+        )
+        self._log_bytes = new_size
+        self._log_records = records
+    
     def _validate_cache_data(self, data: Dict[str, Any]) -> bool:
-        """Valide la structure des données de cache."""
+        """Valide la structure des données de cache.
+        
+        Les horodatages ISO des anciens formats sont convertis en secondes
+        epoch au passage, une seule fois au chargement.
+        """
         required_fields = ['timestamp', 'results']
-        return all(field in data for field in required_fields)
+        if not all(field in data for field in required_fields):
+            return False
+        
+        if isinstance(data['timestamp'], str):
+            try:
+                data['timestamp'] = datetime.fromisoformat(data['timestamp']).timestamp()
+            except ValueError:
+                return False
+        return True
     
-    def _calculate_freshness_score(self, timestamp: datetime) -> float:
+    def _calculate_freshness_score(self, timestamp: float, now: Optional[float] = None) -> float:
         """Calcule un score de fraîcheur pour les données en cache.
         
         Le score varie de 1.0 (très récent) à 0.0 (expiré).
+        
+        Args:
+            timestamp: Date de mise en cache en secondes epoch
+            now: Heure courante, à fournir une fois pour tout un lot d'entrées
         """
-        age = (datetime.now() - timestamp).total_seconds()
-        return max(0.0, 1.0 - (age / self.expire_after))
+        if now is None:
+            now = time.time()
+        return max(0.0, 1.0 - (now - timestamp) / self.expire_after)
     
     async def get(self, phone: str, country_code: str) -> Optional[Dict[str, Any]]:
         """Récupère les résultats en cache pour un numéro.
@@ -123,161 +561,179 @@ class CacheManager:
         Returns:
             Résultats en cache si valides, None sinon
         """
-        async with self._lock:
-            cache_key = self._get_cache_key(phone, country_code)
-            cached_data = self.cache_data.get(cache_key)
-            
-            if not cached_data:
-                self.stats['misses'] += 1
-                return None
-            
-            # Vérifie la fraîcheur des données
-            timestamp = datetime.fromisoformat(cached_data['timestamp'])
-            freshness = self._calculate_freshness_score(timestamp)
-            
-            if freshness <= 0:
-                # Données expirées, on les supprime
-                await self._remove_entry(cache_key)
-                self.stats['misses'] += 1
-                logger.debug(f"Entrée de cache expirée supprimée: {cache_key}")
-                return None
+        cache_key = self._get_cache_key(phone, country_code)
+        async with self._lock_for(cache_key):
+            return await self._lookup(cache_key, time.time())
+    
+    async def mget(self, numbers: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """Récupère en un seul appel les résultats en cache de plusieurs numéros.
+        
+        Args:
+            numbers: Couples (numéro, code pays)
             
-            # Hit de cache
-            self.stats['hits'] += 1
-            cached_data['freshness_score'] = freshness
-            logger.debug(f"Cache hit: {cache_key} (fraîcheur: {freshness:.2f})")
-            return cached_data
+        Returns:
+            Résultats en cache (ou None) dans l'ordre des numéros
+        """
+        now = time.time()
+        results = []
+        for phone, country_code in numbers:
+            cache_key = self._get_cache_key(phone, country_code)
+            async with self._lock_for(cache_key):
+                results.append(await self._lookup(cache_key, now))
+        return results
+    
+    async def _lookup(self, cache_key: str, now: float) -> Optional[Dict[str, Any]]:
+        """Lit une entrée, verrou de la clé déjà acquis."""
+        entry = self.cache_data.get(cache_key)
+        
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        
+        # Vérifie la fraîcheur des données
+        freshness = self._calculate_freshness_score(entry.timestamp, now)
+        
+        if freshness <= 0:
+            # Données expirées, on les supprime
+            await self._remove_entry(cache_key)
+            self.stats['misses'] += 1
+            logger.debug("Entrée de cache expirée supprimée: %s", cache_key)
+            return None
+        
+        # Décode les données au premier accès
+        try:
+            data = entry.data
+        except ValueError as e:
+            await self._remove_entry(cache_key)
+            self.stats['misses'] += 1
+            logger.warning(f"Entrée de cache invalide supprimée: {cache_key} ({e})")
+            return None
+        
+        # Hit de cache
+        self.stats['hits'] += 1
+        self.cache_data.move_to_end(cache_key)
+        logger.debug("Cache hit: %s (fraîcheur: %.2f)", cache_key, freshness)
+        # Copie superficielle : le score, propre à cette lecture, n'est pas
+        # ajouté à l'entrée stockée
+        return {**data, 'freshness_score': freshness}
     
     async def set(self, phone: str, country_code: str, results: Dict[str, Any]):
         """Stocke les résultats en cache pour un numéro."""
-        async with self._lock:
-            cache_key = self._get_cache_key(phone, country_code)
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'results': results,
-                'phone': phone,
-                'country_code': country_code
-            }
-            
-            # Calcule la taille des nouvelles données
-            data_str = json.dumps(cache_data, indent=2)
-            data_size = len(data_str.encode('utf-8'))
-            
-            # Vérifie si on dépasse la limite de taille
-            if self.stats['size_bytes'] + data_size > self.max_size_mb * 1024 * 1024:
-                await self._evict_old_entries()
-            
-            # Sauvegarde en mémoire
-            old_size = 0
-            if cache_key in self.cache_data:
-                # Mise à jour d'une entrée existante
-                old_entry = self.cache_data[cache_key]
-                old_size = len(json.dumps(old_entry).encode('utf-8'))
-            else:
-                self.stats['entries_count'] += 1
-            
-            self.cache_data[cache_key] = cache_data
-            self.stats['size_bytes'] = self.stats['size_bytes'] - old_size + data_size
-            
-            # Sauvegarde sur disque
-            cache_file = self._get_cache_file(phone, country_code)
-            try:
-                async with aiofiles.open(cache_file, mode='w', encoding='utf-8') as f:
-                    await f.write(data_str)
-                
-                logger.debug(f"Entrée sauvegardée en cache: {cache_key} ({self._format_size(data_size)})")
-                
-            except Exception as e:
-                # En cas d'erreur d'écriture, on retire l'entrée de la mémoire
-                if cache_key in self.cache_data:
-                    del self.cache_data[cache_key]
-                    self.stats['entries_count'] -= 1
-                    self.stats['size_bytes'] -= data_size
-                logger.error(f"Erreur lors de la sauvegarde en cache: {e}")
+        cache_key = self._get_cache_key(phone, country_code)
+        async with self._lock_for(cache_key):
+            await self._store(cache_key, phone, country_code, results, time.time())
+    
+    async def _store(
+        self,
+        cache_key: str,
+        phone: str,
+        country_code: str,
+        results: Dict[str, Any],
+        timestamp: float
+    ):
+        """Écrit une entrée, verrou de la clé déjà acquis."""
+        cache_data = {
+            'timestamp': timestamp,
+            'results': results,
+            'phone': phone,
+            'country_code': country_code
+        }
+        
+        # Calcule la taille des nouvelles données
+        payload = self._encode_data(cache_data)
+        data_size = len(payload)
+        
+        # Vérifie si on dépasse la limite de taille
+        if self.stats['size_bytes'] + data_size > self.max_size_mb * 1024 * 1024:
+            await self._evict_old_entries()
+        
+        # Sauvegarde en mémoire
+        old_entry = self.cache_data.get(cache_key)
+        if old_entry is None:
+            self.stats['entries_count'] += 1
+        else:
+            self.stats['size_bytes'] -= old_entry.size
+        
+        self.cache_data[cache_key] = CacheEntry(data_size, timestamp, data=cache_data)
+        self.cache_data.move_to_end(cache_key)
+        self.stats['size_bytes'] += data_size
+        
+        # Sauvegarde sur disque différée
+        self._mark_dirty(cache_key, timestamp, payload)
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Entrée mise en cache: %s (%s)", cache_key, self._format_size(data_size))
     
     async def invalidate(self, phone: str, country_code: str):
         """Invalide le cache pour un numéro spécifique."""
-        async with self._lock:
-            cache_key = self._get_cache_key(phone, country_code)
+        cache_key = self._get_cache_key(phone, country_code)
+        async with self._lock_for(cache_key):
             await self._remove_entry(cache_key)
-            logger.debug(f"Cache invalidé: {cache_key}")
+            logger.debug("Cache invalidé: %s", cache_key)
     
     async def _remove_entry(self, cache_key: str):
         """Supprime une entrée du cache (mémoire et disque)."""
-        if cache_key in self.cache_data:
-            # Calcule la taille de l'entrée
-            entry_size = len(json.dumps(self.cache_data[cache_key]).encode('utf-8'))
-            
+        entry = self.cache_data.pop(cache_key, None)
+        if entry is not None:
             # Supprime de la mémoire
-            del self.cache_data[cache_key]
             self.stats['entries_count'] -= 1
-            self.stats['size_bytes'] -= entry_size
+            self.stats['size_bytes'] -= entry.size
             
-            # Supprime du disque
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            if cache_file.exists():
-                try:
-                    await aiofiles.os.remove(str(cache_file))
-                except Exception as e:
-                    logger.error(f"Erreur lors de la suppression du fichier de cache: {e}")
+            # Enregistre la suppression dans le journal
+            self._mark_dirty(cache_key, entry.timestamp)
     
     async def _evict_old_entries(self):
-        """Supprime les entrées les plus anciennes pour libérer de l'espace."""
+        """Supprime les entrées les moins récemment utilisées pour libérer de l'espace."""
         if not self.cache_data:
             return
         
-        # Trie les entrées par âge (plus anciennes en premier)
-        entries_by_age = []
-        for cache_key, data in self.cache_data.items():
-            timestamp = datetime.fromisoformat(data['timestamp'])
-            entries_by_age.append((timestamp, cache_key))
-        
-        entries_by_age.sort(key=lambda x: x[0])
-        
         # Supprime les entrées jusqu'à atteindre 80% de la limite
         target_size = self.max_size_mb * 1024 * 1024 * 0.8
         
-        for timestamp, cache_key in entries_by_age:
-            if self.stats['size_bytes'] <= target_size:
-                break
-            
-            await self._remove_entry(cache_key)
+        while self.cache_data and self.stats['size_bytes'] > target_size:
+            cache_key, entry = self.cache_data.popitem(last=False)
+            self.stats['entries_count'] -= 1
+            self.stats['size_bytes'] -= entry.size
             self.stats['evictions'] += 1
+            self._mark_dirty(cache_key, entry.timestamp)
         
         logger.info(f"Éviction terminée: {self.stats['evictions']} entrées supprimées")
     
     async def _cleanup_expired(self):
         """Nettoie les entrées expirées au démarrage."""
-        expired_keys = []
-        current_time = datetime.now()
-        
-        for cache_key, data in self.cache_data.items():
-            timestamp = datetime.fromisoformat(data['timestamp'])
-            if (current_time - timestamp).total_seconds() > self.expire_after:
-                expired_keys.append(cache_key)
+        # Une seule comparaison par entrée avec une date limite calculée une fois
+        cutoff = time.time() - self.expire_after
+        expired_keys = [
+            cache_key for cache_key, entry in self.cache_data.items()
+            if entry.timestamp < cutoff
+        ]
         
         for cache_key in expired_keys:
             await self._remove_entry(cache_key)
         
         if expired_keys:
             logger.info(f"Nettoyage initial: {len(expired_keys)} entrées expirées supprimées")
+        
+        await self.flush()
     
     async def clear_all(self):
         """Vide complètement le cache."""
-        async with self._lock:
-            # Supprime tous les fichiers
-            cache_files = list(self.cache_dir.glob("*.json"))
-            for cache_file in cache_files:
-                try:
-                    await aiofiles.os.remove(str(cache_file))
-                except Exception as e:
-                    logger.error(f"Erreur lors de la suppression de {cache_file}: {e}")
-            
-            # Remet à zéro les données en mémoire
+        async with self._flush_lock:
+            # Remet à zéro les données en mémoire et les écritures en attente
+            # avant toute suspension, pour ne pas effacer une écriture concurrente
             self.cache_data.clear()
+            self._dirty.clear()
             self.stats['entries_count'] = 0
             self.stats['size_bytes'] = 0
             
+            # Supprime le journal
+            if self.log_path.exists():
+                try:
+                    await self._run_blocking(self._remove_log)
+                except Exception as e:
+                    logger.error(f"Erreur lors de la suppression de {self.log_path}: {e}")
+            self._log_bytes = 0
+            self._log_records = 0
+            
             logger.info("Cache complètement vidé")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -297,11 +753,9 @@ class CacheManager:
     
     def _format_size(self, size_bytes: int) -> str:
         """Formate une taille en bytes de manière lisible."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Chaque unité couvre 10 bits : l'index se déduit directement de bit_length
+        index = min(len(_SIZE_UNITS) - 1, max(0, int(size_bytes).bit_length() - 1) // 10)
+        return f"{size_bytes / _SIZE_SCALES[index]:.1f} {_SIZE_UNITS[index]}"
     
     async def get_cache_info(self) -> Dict[str, Any]:
         """Retourne des informations détaillées sur le cache."""
@@ -316,16 +770,20 @@ class CacheManager:
         }
         
         # Ajoute des informations sur chaque entrée
-        for cache_key, data in list(self.cache_data.items())[:10]:  # Limite à 10 entrées
-            timestamp = datetime.fromisoformat(data['timestamp'])
-            freshness = self._calculate_freshness_score(timestamp)
+        now = time.time()
+        for cache_key, entry in islice(self.cache_data.items(), 10):  # Limite à 10 entrées
+            freshness = self._calculate_freshness_score(entry.timestamp, now)
+            try:
+                platforms = list(entry.data.get('results', {}).keys())
+            except ValueError:
+                platforms = []
             
             info['entries'].append({
                 'key': cache_key,
-                'timestamp': data['timestamp'],
+                'timestamp': datetime.fromtimestamp(entry.timestamp).isoformat(),
                 'freshness': freshness,
-                'platforms': list(data.get('results', {}).keys()),
-                'size': len(json.dumps(data).encode('utf-8'))
+                'platforms': platforms,
+                'size': entry.size
             })
         
         return info
@@ -5,8 +5,35 @@ plusieurs facteurs pour évaluer la fiabilité d'une vérification.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+# Score associé à chaque code HTTP (0.5 pour les codes non listés)
+_STATUS_SCORES: Dict[int, float] = {
+    200: 1.0,
+    201: 0.9, 202: 0.9, 203: 0.9,
+    429: 0.3, 503: 0.3,  # Rate limiting ou service indisponible
+}
+_DEFAULT_STATUS_SCORE = 0.5
+
+# Durée (secondes) au-delà de laquelle des données en cache ont un score nul
+_CACHE_MAX_AGE = 24 * 3600
+
+def _api_response_score(status_code: int, response_time: float) -> float:
+    """Score de qualité d'une réponse API (code HTTP et temps en secondes)."""
+    status_score = _STATUS_SCORES.get(status_code, _DEFAULT_STATUS_SCORE)
+    
+    # Score basé sur le temps de réponse (1.0 si <0.5s, 0.0 si >5s)
+    time_score = max(0.0, min(1.0, (5.0 - response_time) / 4.5))
+    
+    return (status_score * 0.7) + (time_score * 0.3)
+
+def _cache_age_score(age: float) -> float:
+    """Score de fraîcheur de données en cache âgées de age secondes.
+    
+    Score dégressif sur 24 heures.
+    """
+    return max(0.0, 1.0 - (age / _CACHE_MAX_AGE))
 
 @dataclass
 class PlatformReliability:
@@ -17,11 +44,24 @@ class PlatformReliability:
         api_timeouts: Nombre de timeouts récents
         success_rate: Taux de succès des dernières vérifications
         last_failure: Timestamp du dernier échec
+        cached_score: Score de la plateforme précalculé par refresh_score
     """
     base_score: float = 0.8  # Score par défaut
     api_timeouts: int = 0
     success_rate: float = 1.0
     last_failure: Optional[datetime] = None
+    cached_score: float = field(default=0.0, init=False, repr=False)
+    
+    def __post_init__(self):
+        self.refresh_score()
+    
+    def refresh_score(self):
+        """Recalcule le score de la plateforme après une mise à jour des statistiques."""
+        self.cached_score = (
+            self.base_score *
+            self.success_rate *
+            (0.9 ** self.api_timeouts)  # Pénalité pour les timeouts
+        )
 
 class ConfidenceScorer:
     """Calculateur de scores de confiance pour les vérifications."""
@@ -35,6 +75,9 @@ class ConfidenceScorer:
             'snapchat': PlatformReliability(base_score=0.7)    # Moins fiable
         }
         
+        # Valeurs par défaut partagées pour les plateformes inconnues
+        self.default_reliability = PlatformReliability()
+        
         # Facteurs de pondération pour différents aspects
         self.weights = {
             'platform_reliability': 0.4,  # Fiabilité historique de la plateforme
@@ -52,20 +95,7 @@ class ConfidenceScorer:
         Returns:
             Score entre 0.0 et 1.0
         """
-        # Score basé sur le status code
-        if status_code == 200:
-            status_score = 1.0
-        elif status_code in (201, 202, 203):
-            status_score = 0.9
-        elif status_code in (429, 503):  # Rate limiting ou service indisponible
-            status_score = 0.3
-        else:
-            status_score = 0.5
-            
-        # Score basé sur le temps de réponse (1.0 si <0.5s, 0.0 si >5s)
-        time_score = max(0.0, min(1.0, (5.0 - response_time) / 4.5))
-        
-        return (status_score * 0.7) + (time_score * 0.3)
+        return _api_response_score(status_code, response_time)
     
     def calculate_cache_age_score(self, timestamp: datetime) -> float:
         """Calcule un score basé sur l'âge des données en cache.
@@ -76,11 +106,7 @@ class ConfidenceScorer:
         Returns:
             Score entre 0.0 et 1.0 (1.0 = très récent, 0.0 = très ancien)
         """
-        age = (datetime.now() - timestamp).total_seconds()
-        
-        # Score dégressif sur 24 heures
-        max_age = 24 * 3600  # 24 heures en secondes
-        return max(0.0, 1.0 - (age / max_age))
+        return _cache_age_score((datetime.now() - timestamp).total_seconds())
     
     def update_platform_reliability(
         self,
@@ -111,6 +137,8 @@ class ConfidenceScorer:
             reliability.last_failure = datetime.now()
             if response_time and response_time > 5.0:
                 reliability.api_timeouts += 1
+        
+        reliability.refresh_score()
     
     def get_confidence_score(
         self,
@@ -131,15 +159,8 @@ class ConfidenceScorer:
             Score de confiance entre 0.0 et 1.0
         """
         # Score de fiabilité de la plateforme
-        reliability = self.platform_scores.get(
-            platform,
-            PlatformReliability()  # Valeurs par défaut pour plateformes inconnues
-        )
-        platform_score = (
-            reliability.base_score *
-            reliability.success_rate *
-            (0.9 ** reliability.api_timeouts)  # Pénalité pour les timeouts
-        )
+        reliability = self.platform_scores.get(platform, self.default_reliability)
+        platform_score = reliability.cached_score
         
         # Score de la réponse API
         api_score = self.calculate_api_response_score(status_code, response_time)
@@ -159,3 +180,65 @@ class ConfidenceScorer:
         )
         
         return round(final_score, 2)  # Arrondi à 2 décimales
+    
+    def get_confidence_scores_batch(
+        self,
+        platforms: Sequence[str],
+        status_codes: Sequence[int],
+        response_times: Sequence[float],
+        cache_timestamps: Optional[Sequence[Optional[datetime]]] = None
+    ) -> List[float]:
+        """Calcule les scores de confiance d'un lot de vérifications.
+        
+        Équivalent à appeler get_confidence_score pour chaque élément, mais
+        les poids, l'heure courante et les scores des plateformes ne sont
+        lus qu'une seule fois pour tout le lot.
+        
+        Args:
+            platforms: Nom de la plateforme de chaque vérification
+            status_codes: Code HTTP de chaque réponse
+            response_times: Temps de réponse de chaque vérification en secondes
+            cache_timestamps: Date de mise en cache de chaque vérification (optionnel)
+            
+        Returns:
+            Scores de confiance entre 0.0 et 1.0, dans l'ordre des entrées
+            
+        Raises:
+            ValueError: Si les séquences n'ont pas toutes la même longueur
+        """
+        if cache_timestamps is None:
+            cache_timestamps = [None] * len(platforms)
+        if not (
+            len(platforms) == len(status_codes) == len(response_times) == len(cache_timestamps)
+        ):
+            raise ValueError("Les séquences du lot doivent avoir la même longueur")
+        
+        platform_weight = self.weights['platform_reliability']
+        api_weight = self.weights['api_response']
+        cache_weight = self.weights['cache_age']
+        
+        default_score = self.default_reliability.cached_score
+        platform_scores = {
+            platform: reliability.cached_score
+            for platform, reliability in self.platform_scores.items()
+        }
+        now = datetime.now()
+        
+        scores = []
+        for platform, status_code, response_time, cache_timestamp in zip(
+            platforms, status_codes, response_times, cache_timestamps
+        ):
+            cache_score = (
+                _cache_age_score((now - cache_timestamp).total_seconds())
+                if cache_timestamp
+                else 1.0
+            )
+            
+            scores.append(round(
+                platform_scores.get(platform, default_score) * platform_weight +
+                _api_response_score(status_code, response_time) * api_weight +
+                cache_score * cache_weight,
+                2
+            ))
+        
+        return scores
@@ -5,12 +5,22 @@ incluant les paramètres des APIs, le cache, et les limites de rate limiting.
 """
 
 import os
+import sys
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
-@dataclass
+# Décodage/encodage JSON via orjson (extension C) si disponible
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# `slots=True` n'existe qu'à partir de Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class PlatformConfig:
     """Configuration pour une plateforme spécifique."""
     enabled: bool = True
@@ -20,7 +30,7 @@ class PlatformConfig:
     retry_attempts: int = 3
     custom_headers: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CacheConfig:
     """Configuration du système de cache."""
     enabled: bool = True
@@ -28,13 +38,16 @@ class CacheConfig:
     expire_after: int = 3600  # 1 heure
     max_size_mb: int = 100
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LoggingConfig:
     """Configuration du système de logging."""
     level: str = 'INFO'
     format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     file_path: Optional[str] = None
     console_output: bool = True
+    # 'size' : rotation intégrée par taille ; 'external' : le fichier est
+    # seulement rouvert s'il a été déplacé (rotation confiée à logrotate)
+    rotation_strategy: str = 'size'
 
 class Config:
     """Gestionnaire de configuration principal."""
@@ -87,8 +100,9 @@ class Config:
         # Charge depuis le fichier si il existe
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                config_data = orjson.loads(raw) if orjson else json.loads(raw)
                 self._apply_file_config(config_data)
             except Exception as e:
                 print(f"Erreur lors du chargement de la configuration: {e}")
@@ -110,6 +124,9 @@ class Config:
             log_config = config_data['logging']
             self.logging.level = log_config.get('level', self.logging.level)
             self.logging.file_path = log_config.get('file_path', self.logging.file_path)
+            self.logging.rotation_strategy = log_config.get(
+                'rotation_strategy', self.logging.rotation_strategy
+            )
         
         # Plateformes
         if 'platforms' in config_data:
@@ -121,24 +138,43 @@ class Config:
                     current.rate_limit_period = platform_config.get('rate_limit_period', current.rate_limit_period)
     
     def _apply_env_config(self):
-        """Applique la configuration depuis les variables d'environnement."""
+        """Applique la configuration depuis les variables d'environnement.
+        
+        L'environnement est relu à chaque construction d'une configuration :
+        une variable définie après l'import du paquet est prise en compte.
+        """
+        env = os.environ
+        
         # Cache
-        if os.getenv('PHONE_CHECKER_CACHE_ENABLED'):
-            self.cache.enabled = os.getenv('PHONE_CHECKER_CACHE_ENABLED').lower() == 'true'
+        value = env.get('PHONE_CHECKER_CACHE_ENABLED')
+        if value:
+            self.cache.enabled = value.lower() == 'true'
         
-        if os.getenv('PHONE_CHECKER_CACHE_DIR'):
-            self.cache.directory = os.getenv('PHONE_CHECKER_CACHE_DIR')
+        value = env.get('PHONE_CHECKER_CACHE_DIR')
+        if value:
+            self.cache.directory = value
         
         # Logging
-        if os.getenv('PHONE_CHECKER_LOG_LEVEL'):
-            self.logging.level = os.getenv('PHONE_CHECKER_LOG_LEVEL')
+        value = env.get('PHONE_CHECKER_LOG_LEVEL')
+        if value:
+            self.logging.level = value
         
-        if os.getenv('PHONE_CHECKER_LOG_FILE'):
-            self.logging.file_path = os.getenv('PHONE_CHECKER_LOG_FILE')
+        value = env.get('PHONE_CHECKER_LOG_FILE')
+        if value:
+            self.logging.file_path = value
+        
+        value = env.get('PHONE_CHECKER_LOG_ROTATION')
+        if value:
+            self.logging.rotation_strategy = value
     
     def get_platform_config(self, platform: str) -> PlatformConfig:
-        """Retourne la configuration pour une plateforme."""
-        return self.platforms.get(platform, PlatformConfig())
+        """Retourne la configuration pour une plateforme.
+        
+        Les plateformes inconnues reçoivent une nouvelle configuration par
+        défaut, qui peut être modifiée sans affecter les autres.
+        """
+        config = self.platforms.get(platform)
+        return config if config is not None else PlatformConfig()
     
     def save_config(self, file_path: Optional[str] = None):
         """Sauvegarde la configuration actuelle dans un fichier JSON."""
@@ -155,7 +191,8 @@ class Config:
                 'level': self.logging.level,
                 'format': self.logging.format,
                 'file_path': self.logging.file_path,
-                'console_output': self.logging.console_output
+                'console_output': self.logging.console_output,
+                'rotation_strategy': self.logging.rotation_strategy
             },
             'platforms': {}
         }
@@ -170,10 +207,37 @@ class Config:
             }
         
         # Crée le répertoire si nécessaire
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        if orjson:
+            raw = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Écriture directe sur le descripteur, sans couche de buffering
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            view = memoryview(raw)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+# Instance globale par défaut, créée au premier accès
+_default_config: Optional[Config] = None
+
+def get_default_config() -> Config:
+    """Retourne la configuration globale, chargée au premier appel."""
+    global _default_config
+    if _default_config is None:
+        _default_config = Config()
+    return _default_config
 
-# Instance globale par défaut
-default_config = Config()
+def __getattr__(name: str):
+    # Compatibilité : `from phone_checker.config import default_config`
+    if name == 'default_config':
+        return get_default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,18 +5,39 @@ la logique centrale de l'application, y compris le cache et la concurrence.
 """
 
 import asyncio
+import importlib.util
 import time
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator, Sequence
 import httpx
 from datetime import datetime
 
 from .models import PhoneCheckResult, PhoneCheckRequest, PhoneCheckResponse, VerificationStatus
 from .platforms import AVAILABLE_CHECKERS, DEFAULT_PLATFORMS
 from .cache import CacheManager
-from .utils import validate_phone_number, clean_phone_number, anonymize_phone_number
-from .config import default_config
+from .utils import validate_phone_number, clean_phone_number, anonymize_phone_number, SingleFlight
+from .config import get_default_config
 from .logging import logger
 
+# HTTP/2 (multiplexage des requêtes sur une connexion) si le paquet h2 est installé
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Parsing phonenumbers mémorisé : un même numéro revient souvent d'un appel
+# à l'autre (lots, relances). clean_phone_number, simple regex, n'en a pas besoin.
+_validate_phone_number = lru_cache(maxsize=8192)(validate_phone_number)
+_anonymize_phone_number = lru_cache(maxsize=8192)(anonymize_phone_number)
+
+# Premier hôte contacté par chaque vérificateur, préchauffé à l'ouverture
+_PLATFORM_HOSTS = {
+    'whatsapp': 'https://wa.me',
+    'telegram': 'https://my.telegram.org',
+    'instagram': 'https://www.instagram.com',
+    'snapchat': 'https://accounts.snapchat.com'
+}
+
+# Délai maximal d'une requête de préchauffage, en secondes
+_WARMUP_TIMEOUT = 5.0
+
 class PhoneChecker:
     """Classe principale pour la vérification des numéros de téléphone."""
     
@@ -26,7 +47,8 @@ class PhoneChecker:
         proxy_url: Optional[str] = None,
         use_cache: bool = None,
         cache_expire: int = None,
-        max_concurrent_checks: int = 4
+        max_concurrent_checks: int = 4,
+        warmup_connections: bool = False
     ):
         """Initialise le vérificateur avec les options spécifiées.
         
@@ -36,17 +58,28 @@ class PhoneChecker:
             use_cache: Activer le système de cache (utilise config par défaut si None)
             cache_expire: Durée de validité du cache en secondes
             max_concurrent_checks: Nombre maximum de vérifications simultanées
+            warmup_connections: Ouvrir les connexions vers les plateformes dès
+                l'entrée dans le context manager (désactivé par défaut : à
+                réserver aux usages qui vont effectivement vérifier des numéros)
         """
         # Configuration
-        self.config = default_config
+        self.config = get_default_config()
         self.use_cache = use_cache if use_cache is not None else self.config.cache.enabled
         self.max_concurrent_checks = max_concurrent_checks
+        self.warmup_connections = warmup_connections
+        self._warmup_tasks: List[asyncio.Task] = []
         
-        # Client HTTP principal
+        # Client HTTP principal, partagé par tous les vérificateurs pour
+        # réutiliser les connexions keep-alive (pas de handshake TLS par requête)
         self.client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
             proxies=proxy_url,
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=300.0
+            )
         )
         
         # Gestionnaire de cache
@@ -61,24 +94,73 @@ class PhoneChecker:
         self.checkers: Dict[str, Any] = {}
         self._initialize_checkers(platforms or DEFAULT_PLATFORMS)
         
-        # Statistiques
-        self.stats = {
-            'total_checks': 0,
-            'successful_checks': 0,
-            'failed_checks': 0,
-            'cache_hits': 0,
-            'cache_misses': 0
-        }
+        # Vérifications en cours, partagées entre appels concurrents identiques
+        self._inflight_checks = SingleFlight()
+        
+        # Limite globale des vérifications de plateformes simultanées, commune
+        # à tous les appels (créée dans la boucle d'événements au premier usage)
+        self._checks_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Statistiques (compteurs entiers, le dict n'est construit qu'à la lecture)
+        self._total_checks = 0
+        self._successful_checks = 0
+        self._failed_checks = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         logger.info(f"PhoneChecker initialisé avec {len(self.checkers)} plateformes")
     
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Instantané des compteurs d'utilisation."""
+        return {
+            'total_checks': self._total_checks,
+            'successful_checks': self._successful_checks,
+            'failed_checks': self._failed_checks,
+            'cache_hits': self._cache_hits,
+            'cache_misses': self._cache_misses
+        }
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        """Proportion des vérifications servies par le cache."""
+        return self._cache_hits / max(1, self._cache_hits + self._cache_misses)
+    
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """Client HTTP partagé par l'ensemble des vérificateurs."""
+        return self.client
+    
     async def initialize(self):
         """Initialise les composants asynchrones."""
         if self.use_cache:
             await self.cache.initialize()
         logger.debug("PhoneChecker initialisé avec succès")
     
-    def _initialize_checkers(self, platforms: List[str]):
+    def _warm_up_connections(self):
+        """Lance en arrière-plan une requête HEAD vers chaque plateforme.
+        
+        Les handshakes TCP/TLS se font pendant le démarrage et les connexions
+        restent dans le pool du client : la première vérification les réutilise.
+        """
+        for platform, checker in self.checkers.items():
+            url = _PLATFORM_HOSTS.get(platform)
+            if url:
+                self._warmup_tasks.append(
+                    asyncio.create_task(self._warm_up(url, checker.headers))
+                )
+    
+    async def _warm_up(self, url: str, headers: Dict[str, str]):
+        """Ouvre une connexion vers l'hôte avec les headers du vérificateur.
+        
+        Les erreurs sont ignorées : la vérification ouvrira sa propre connexion.
+        """
+        try:
+            await self.client.head(url, headers=headers, timeout=_WARMUP_TIMEOUT)
+        except httpx.HTTPError as e:
+            logger.debug(f"Préchauffage de {url} échoué: {e}")
+    
+    def _initialize_checkers(self, platforms: Sequence[str]):
         """Initialise les vérificateurs pour les plateformes sélectionnées."""
         for platform in platforms:
             if platform in AVAILABLE_CHECKERS:
@@ -110,10 +192,33 @@ class PhoneChecker:
         Returns:
             PhoneCheckResponse avec tous les résultats
         """
-        start_time = time.time()
+        return await self._check_number(phone, country_code, platforms, force_refresh)
+    
+    async def _check_number(
+        self,
+        phone: str,
+        country_code: str,
+        platforms: Optional[List[str]],
+        force_refresh: bool,
+        prefetched: Optional[Dict[Tuple[str, str], Optional[Dict[str, Any]]]] = None
+    ) -> PhoneCheckResponse:
+        """Vérifie un numéro, avec un cache éventuellement pré-lu.
+        
+        Args:
+            phone: Numéro de téléphone sans l'indicatif pays
+            country_code: Indicatif pays
+            platforms: Plateformes à vérifier (toutes par défaut)
+            force_refresh: Force une nouvelle vérification même si en cache
+            prefetched: Entrées de cache déjà lues par (numéro nettoyé, code pays),
+                chacune consommée au premier usage
+            
+        Returns:
+            PhoneCheckResponse avec tous les résultats
+        """
+        start_ns = time.perf_counter_ns()
         
         # Validation et nettoyage du numéro
-        if not validate_phone_number(phone, country_code):
+        if not _validate_phone_number(phone, country_code):
             raise ValueError(f"Numéro invalide: +{country_code}{phone}")
         
         clean_number = clean_phone_number(phone)
@@ -128,68 +233,85 @@ class PhoneChecker:
         )
         
         # Log du début de vérification
-        anonymized = anonymize_phone_number(clean_number, country_code)
-        logger.log_verification_start(anonymized, country_code, request.platforms)
+        anonymized = _anonymize_phone_number(clean_number, country_code)
+        logger.log_verification_start(
+            anonymized, country_code, request.platforms, request.platforms_csv
+        )
         
         try:
             # Vérifie le cache si activé
             cached_results = []
-            platforms_to_check = request.platforms.copy()
+            cached_platforms = set()
+            requested = set(request.platforms)
             
             if self.use_cache and not force_refresh:
-                cached_data = await self.cache.get(clean_number, country_code)
+                if prefetched is not None and (clean_number, country_code) in prefetched:
+                    # Une répétition du numéro plus loin dans le lot relit le
+                    # cache, où le premier résultat a pu être écrit entre-temps
+                    cached_data = prefetched.pop((clean_number, country_code))
+                else:
+                    cached_data = await self.cache.get(clean_number, country_code)
                 if cached_data:
-                    self.stats['cache_hits'] += 1
+                    self._cache_hits += 1
                     logger.log_cache_hit(anonymized, country_code, cached_data['freshness_score'])
                     
-                    # Utilise les résultats en cache
-                    for platform, result_data in cached_data['results'].items():
-                        if platform in request.platforms:
-                            result = PhoneCheckResult.from_dict(result_data)
-                            result.metadata['cached'] = True
-                            result.metadata['freshness_score'] = cached_data['freshness_score']
-                            cached_results.append(result)
-                            platforms_to_check.remove(platform)
+                    # Utilise les résultats en cache (métadonnées copiées pour ne
+                    # pas modifier l'entrée partagée par le cache)
+                    freshness = cached_data['freshness_score']
+                    cached_results = [
+                        PhoneCheckResult.from_dict({
+                            **result_data,
+                            'metadata': {
+                                **result_data.get('metadata', {}),
+                                'cached': True,
+                                'freshness_score': freshness
+                            }
+                        })
+                        for platform, result_data in cached_data['results'].items()
+                        if platform in requested
+                    ]
+                    cached_platforms = requested.intersection(cached_data['results'])
+            
+            # Plateformes restantes, dans l'ordre demandé et sans doublons
+            platforms_to_check = [
+                platform for platform in dict.fromkeys(request.platforms)
+                if platform not in cached_platforms
+            ]
             
-            if not platforms_to_check and cached_results:
-                # Tous les résultats sont en cache
+            if not platforms_to_check:
+                # Tous les résultats sont en cache, rien à vérifier
                 response = PhoneCheckResponse(
                     request=request,
                     results=cached_results,
-                    total_time=(time.time() - start_time) * 1000
+                    total_time=(time.perf_counter_ns() - start_ns) / 1_000_000
                 )
                 logger.info(f"Vérification terminée (cache): {len(cached_results)} résultats")
                 return response
-            else:
-                self.stats['cache_misses'] += 1
-                logger.log_cache_miss(anonymized, country_code)
             
-            # Effectue les vérifications nécessaires
-            new_results = await self._perform_checks(
-                clean_number, 
-                country_code, 
-                platforms_to_check
+            self._cache_misses += 1
+            logger.log_cache_miss(anonymized, country_code)
+            
+            # Effectue les vérifications nécessaires (une seule fois pour des
+            # appels concurrents portant sur le même numéro et les mêmes plateformes)
+            new_results = await self._inflight_checks.do(
+                (country_code, clean_number, tuple(platforms_to_check)),
+                lambda: self._check_and_cache(clean_number, country_code, platforms_to_check)
             )
             
             # Combine les résultats
             all_results = cached_results + new_results
             
-            # Met en cache les nouveaux résultats
-            if self.use_cache and new_results:
-                results_dict = {r.platform: r.to_dict() for r in new_results}
-                await self.cache.set(clean_number, country_code, results_dict)
-            
             # Crée la réponse finale
             response = PhoneCheckResponse(
                 request=request,
                 results=all_results,
-                total_time=(time.time() - start_time) * 1000
+                total_time=(time.perf_counter_ns() - start_ns) / 1_000_000
             )
             
             # Met à jour les statistiques
-            self.stats['total_checks'] += len(all_results)
-            self.stats['successful_checks'] += response.successful_checks
-            self.stats['failed_checks'] += response.failed_checks
+            self._total_checks += len(all_results)
+            self._successful_checks += response.successful_checks
+            self._failed_checks += response.failed_checks
             
             logger.info(
                 f"Vérification terminée: {len(all_results)} résultats "
@@ -202,6 +324,30 @@ class PhoneChecker:
             logger.error(f"Erreur lors de la vérification: {e}")
             raise
     
+    async def _check_and_cache(
+        self,
+        phone: str,
+        country_code: str,
+        platforms: List[str]
+    ) -> List[PhoneCheckResult]:
+        """Effectue les vérifications puis met les nouveaux résultats en cache.
+        
+        Args:
+            phone: Numéro nettoyé
+            country_code: Code pays
+            platforms: Plateformes à vérifier
+            
+        Returns:
+            Liste des résultats de vérification
+        """
+        new_results = await self._perform_checks(phone, country_code, platforms)
+        
+        if self.use_cache and new_results:
+            results_dict = {r.platform: r.to_dict() for r in new_results}
+            await self.cache.set(phone, country_code, results_dict)
+        
+        return new_results
+    
     async def _perform_checks(
         self, 
         phone: str, 
@@ -218,16 +364,23 @@ class PhoneChecker:
         Returns:
             Liste des résultats de vérification
         """
-        # Limite la concurrence
-        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+        # Limite la concurrence, tous appels confondus
+        if self._checks_semaphore is None:
+            self._checks_semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+        semaphore = self._checks_semaphore
+        
+        # Attributs résolus une fois, lus comme variables locales dans la closure
+        get_checker = self.checkers.get
+        error_status = VerificationStatus.ERROR
+        log_error = logger.error
         
         async def check_with_semaphore(platform: str):
             async with semaphore:
-                checker = self.checkers.get(platform)
+                checker = get_checker(platform)
                 if not checker:
                     return PhoneCheckResult(
                         platform=platform,
-                        status=VerificationStatus.ERROR,
+                        status=error_status,
                         exists=False,
                         error=f"Vérificateur {platform} non disponible"
                     )
@@ -235,59 +388,112 @@ class PhoneChecker:
                 try:
                     return await checker.check(phone, country_code)
                 except Exception as e:
-                    logger.error(f"Erreur vérificateur {platform}: {e}")
+                    log_error(f"Erreur vérificateur {platform}: {e}")
                     return PhoneCheckResult(
                         platform=platform,
-                        status=VerificationStatus.ERROR,
+                        status=error_status,
                         exists=False,
                         error=str(e)
                     )
         
-        # Lance toutes les vérifications en parallèle
-        tasks = [check_with_semaphore(platform) for platform in platforms]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filtre les résultats valides
-        valid_results = []
-        for result in results:
-            if isinstance(result, PhoneCheckResult):
-                valid_results.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Exception lors de la vérification: {result}")
-                # Crée un résultat d'erreur
-                valid_results.append(PhoneCheckResult(
-                    platform="unknown",
-                    status=VerificationStatus.ERROR,
-                    exists=False,
-                    error=str(result)
-                ))
-        
-        return valid_results
+        # Lance toutes les vérifications en parallèle ; check_with_semaphore
+        # convertit déjà chaque erreur en PhoneCheckResult, dans l'ordre demandé
+        return list(await asyncio.gather(
+            *(check_with_semaphore(platform) for platform in platforms)
+        ))
     
     async def check_multiple_numbers(
         self,
-        numbers: List[Dict[str, str]],
-        platforms: Optional[List[str]] = None
+        numbers: List[Any],
+        platforms: Optional[List[str]] = None,
+        max_concurrent: Optional[int] = None
     ) -> List[PhoneCheckResponse]:
         """Vérifie plusieurs numéros en parallèle.
         
         Args:
-            numbers: Liste de dict avec 'phone' et 'country_code'
+            numbers: Liste de dict avec 'phone' et 'country_code', ou d'objets
+                exposant les attributs phone et country_code
             platforms: Plateformes à vérifier
+            max_concurrent: Nombre maximum de numéros vérifiés simultanément
+                (utilise max_concurrent_checks si None)
             
         Returns:
-            Liste des PhoneCheckResponse
+            Liste des PhoneCheckResponse (ou de l'exception levée pour un
+            numéro), dans l'ordre des numéros
         """
-        tasks = []
-        for number_info in numbers:
-            task = self.check_number(
-                phone=number_info['phone'],
-                country_code=number_info['country_code'],
-                platforms=platforms
-            )
-            tasks.append(task)
+        responses: List[Any] = [None] * len(numbers)
+        async for index, response in self.iter_multiple_numbers(numbers, platforms, max_concurrent):
+            responses[index] = response
+        return responses
+    
+    async def iter_multiple_numbers(
+        self,
+        numbers: List[Any],
+        platforms: Optional[List[str]] = None,
+        max_concurrent: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Vérifie plusieurs numéros en parallèle et produit chaque réponse dès qu'elle est prête.
+        
+        Args:
+            numbers: Liste de dict avec 'phone' et 'country_code', ou d'objets
+                exposant les attributs phone et country_code
+            platforms: Plateformes à vérifier
+            max_concurrent: Nombre maximum de numéros vérifiés simultanément
+                (utilise max_concurrent_checks si None)
+            
+        Yields:
+            Couples (position du numéro, PhoneCheckResponse ou exception),
+            dans l'ordre de fin des vérifications
+        """
+        pairs = [
+            (number_info['phone'], number_info['country_code'])
+            if isinstance(number_info, dict)
+            else (number_info.phone, number_info.country_code)
+            for number_info in numbers
+        ]
+        
+        # Lit le cache de tous les numéros valides en un seul appel
+        # (chaque résultat est ensuite écrit dès qu'il est prêt : le cache
+        # regroupe lui-même les écritures sur disque)
+        prefetched = None
+        if self.use_cache:
+            keys = list(dict.fromkeys(
+                (clean_phone_number(phone), country_code)
+                for phone, country_code in pairs
+                if _validate_phone_number(phone, country_code)
+            ))
+            prefetched = dict(zip(keys, await self.cache.mget(keys)))
+        
+        # Limite le nombre de numéros en cours de vérification
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent_checks)
         
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        async def check_with_semaphore(index: int, phone: str, country_code: str):
+            async with semaphore:
+                try:
+                    return index, await self._check_number(
+                        phone,
+                        country_code,
+                        platforms,
+                        False,
+                        prefetched=prefetched
+                    )
+                except Exception as e:
+                    return index, e
+        
+        tasks = [
+            asyncio.create_task(check_with_semaphore(index, phone, country_code))
+            for index, (phone, country_code) in enumerate(pairs)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Abandon anticipé par l'appelant : arrête les vérifications restantes.
+            # Une vérification partagée avec un autre appel (SingleFlight) continue
+            # pour lui ; les résultats déjà obtenus sont déjà dans le cache.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     async def invalidate_cache(self, phone: str, country_code: str):
         """Invalide le cache pour un numéro spécifique."""
@@ -305,11 +511,9 @@ class PhoneChecker:
         """Retourne les statistiques d'utilisation."""
         return {
             **self.stats,
-            'cache_hit_rate': (
-                self.stats['cache_hits'] / max(1, self.stats['cache_hits'] + self.stats['cache_misses'])
-            ),
+            'cache_hit_rate': self.cache_hit_rate,
             'success_rate': (
-                self.stats['successful_checks'] / max(1, self.stats['total_checks'])
+                self._successful_checks / max(1, self._total_checks)
             ),
             'available_platforms': list(self.checkers.keys()),
             'cache_enabled': self.use_cache
@@ -377,24 +581,49 @@ class PhoneChecker:
             }
     
     async def close(self):
-        """Ferme proprement toutes les connexions."""
+        """Ferme proprement toutes les connexions.
+        
+        Chaque ressource est fermée indépendamment : un échec sur l'une
+        n'empêche pas la fermeture des suivantes.
+        """
+        errors = False
         try:
+            # Abandonne les préchauffages encore en cours
+            for task in self._warmup_tasks:
+                task.cancel()
+            await asyncio.gather(*self._warmup_tasks, return_exceptions=True)
+            self._warmup_tasks.clear()
+            
             # Ferme les vérificateurs
             for checker in self.checkers.values():
-                if hasattr(checker, 'close'):
-                    await checker.close()
-            
-            # Ferme le client HTTP principal
+                await checker.close()
+        except Exception as e:
+            errors = True
+            logger.error(f"Erreur lors de la fermeture des vérificateurs: {e}")
+        
+        # Écrit les entrées de cache en attente
+        if self.use_cache:
+            try:
+                await self.cache.close()
+            except Exception as e:
+                errors = True
+                logger.error(f"Erreur lors de la fermeture du cache: {e}")
+        
+        # Ferme le client HTTP principal
+        try:
             await self.client.aclose()
-            
-            logger.info("PhoneChecker fermé proprement")
-            
         except Exception as e:
-            logger.error(f"Erreur lors de la fermeture: {e}")
+            errors = True
+            logger.error(f"Erreur lors de la fermeture du client HTTP: {e}")
+        
+        if not errors:
+            logger.info("PhoneChecker fermé proprement")
     
     async def __aenter__(self):
         """Support pour les context managers."""
         await self.initialize()
+        if self.warmup_connections:
+            self._warm_up_connections()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -4,14 +4,54 @@ Ce module configure et gère tous les logs de l'application
 avec support pour différents niveaux et formats.
 """
 
+import atexit
+import os
+import time
 import logging
 import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
-from .config import default_config
+from .config import get_default_config
 
-class ColoredFormatter(logging.Formatter):
+# Niveau de traçage, sous DEBUG : réservé aux événements très fréquents
+# (lectures du cache), désactivé sauf configuration explicite
+TRACE_LEVEL = 5
+logging.addLevelName(TRACE_LEVEL, 'TRACE')
+
+# Modèles de messages : le texte n'est assemblé que si un handler le formate
+_FMT_START = "Début vérification: +%s%s sur %s"
+_FMT_RESULT = "%s: %s"
+_FMT_ERROR = "Erreur vérification %s: %s"
+_FMT_RATE_LIMIT = "Rate limit %s: attente de %.1fs"
+_FMT_CACHE_HIT = "Cache hit: +%s%s (fraîcheur: %.2f)"
+_FMT_CACHE_MISS = "Cache miss: +%s%s"
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formateur qui ne recalcule la date (strftime) qu'une fois par seconde.
+    
+    Le formatage de %(asctime)s représente l'essentiel du coût d'un
+    enregistrement ; seules les millisecondes changent d'une ligne à l'autre.
+    """
+    
+    _time_cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, prefix)
+        
+        if not self.default_msec_format:
+            return prefix
+        return self.default_msec_format % (prefix, record.msecs)
+
+class ColoredFormatter(CachedTimeFormatter):
     """Formateur avec couleurs pour la console."""
     
     COLORS = {
@@ -23,35 +63,205 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
     
+    # Noms de niveaux déjà colorés, construits une seule fois
+    COLORED_LEVELS = {
+        level: f"{color}{level}\033[0m"
+        for level, color in COLORS.items()
+        if level != 'RESET'
+    }
+    
     def format(self, record):
-        # Ajoute la couleur au niveau de log
-        if record.levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[record.levelname]}"
-                f"{record.levelname}"
-                f"{self.COLORS['RESET']}"
-            )
-        return super().format(record)
+        # Ajoute la couleur au niveau de log, puis restaure le nom d'origine :
+        # le même enregistrement passe aussi par les autres handlers
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELS.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Handler de fichier rotatif à écriture bufferisée.
+    
+    Les enregistrements s'accumulent dans un tampon de 64 Ko au lieu d'un
+    appel système par ligne ; le tampon est vidé pour WARNING et plus, à la
+    rotation et à la fermeture. La taille du fichier est suivie en mémoire
+    pour ne pas forcer de vidage à chaque test de rotation.
+    """
+    
+    buffer_size = 64 * 1024
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None)
+        )
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Taille en octets : les messages accentués font plus d'un octet par caractère
+            size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or 'utf-8'))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class BufferedWatchedFileHandler(logging.handlers.WatchedFileHandler):
+    """Handler de fichier bufferisé pour une rotation externe (logrotate).
+    
+    Comme BufferedRotatingFileHandler, les enregistrements passent par un
+    tampon de 64 Ko. Le fichier n'est comparé au chemin (stat) qu'au moment
+    d'un vidage : pour WARNING et plus, ou au plus une fois par seconde,
+    au lieu d'un stat et d'un vidage par enregistrement.
+    """
+    
+    buffer_size = BufferedRotatingFileHandler.buffer_size
+    
+    # Délai maximal (secondes) entre deux vidages et vérifications du fichier
+    check_interval = 1.0
+    
+    def __init__(self, *args, **kwargs):
+        self._next_check = 0.0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None)
+        )
+    
+    def flush(self):
+        """Vide le tampon puis rouvre le fichier s'il a été déplacé."""
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.flush()
+                self.reopenIfNeeded()
+            self._next_check = time.monotonic() + self.check_interval
+        finally:
+            self.release()
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+                self._statstream()
+            self.stream.write(msg)
+            if record.levelno >= logging.WARNING or time.monotonic() >= self._next_check:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 class PhoneCheckerLogger:
-    """Gestionnaire de logging personnalisé pour Phone Checker."""
+    """Gestionnaire de logging personnalisé pour Phone Checker.
+    
+    Les loggers ne portent qu'un QueueHandler : un appel de log dépose
+    l'enregistrement dans une file partagée et un QueueListener, sur un
+    thread d'arrière-plan, le formate et l'écrit (console, fichier).
+    """
+    
+    # File et écouteur partagés par tous les loggers du package
+    _queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener: Optional[logging.handlers.QueueListener] = None
     
     def __init__(self, name: str = 'phone_checker'):
         self.logger = logging.getLogger(name)
         self.setup_logging()
     
+    def _log(self, level: int, message: str, args: tuple, fields: Dict[str, Any]):
+        """Transmet au logger standard, les champs nommés servant de ``extra``.
+        
+        Le niveau est testé avant tout travail ; l'enregistrement est
+        attribué à l'appelant de debug/info/... (stacklevel).
+        """
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, message, *args, extra=fields or None, stacklevel=3)
+    
+    def debug(self, message: str, *args, **kwargs):
+        """Log au niveau DEBUG."""
+        self._log(logging.DEBUG, message, args, kwargs)
+    
+    def info(self, message: str, *args, **kwargs):
+        """Log au niveau INFO."""
+        self._log(logging.INFO, message, args, kwargs)
+    
+    def warning(self, message: str, *args, **kwargs):
+        """Log au niveau WARNING."""
+        self._log(logging.WARNING, message, args, kwargs)
+    
+    def error(self, message: str, *args, **kwargs):
+        """Log au niveau ERROR."""
+        self._log(logging.ERROR, message, args, kwargs)
+    
+    def critical(self, message: str, *args, **kwargs):
+        """Log au niveau CRITICAL."""
+        self._log(logging.CRITICAL, message, args, kwargs)
+    
     def setup_logging(self):
         """Configure le système de logging."""
-        config = default_config.logging
+        config = get_default_config().logging
         
-        # Configure le niveau
-        level = getattr(logging, config.level.upper(), logging.INFO)
+        # Configure le niveau (INFO si le nom est inconnu)
+        level = logging.getLevelName(config.level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
         self.logger.setLevel(level)
         
-        # Évite la duplication des handlers
-        if self.logger.handlers:
+        # Évite la duplication des handlers ; les loggers enfants
+        # ('phone_checker.x') passent par le handler de leur parent
+        if self.logger.handlers or self._parent_has_queue_handler():
             return
         
+        if PhoneCheckerLogger._listener is None:
+            PhoneCheckerLogger._listener = self._start_listener(config, level)
+        
+        if PhoneCheckerLogger._listener.handlers:
+            self.logger.addHandler(logging.handlers.QueueHandler(PhoneCheckerLogger._queue))
+        else:
+            # Aucune sortie configurée : les enregistrements sont ignorés au
+            # lieu de finir dans le handler de dernier recours de logging
+            self.logger.addHandler(logging.NullHandler())
+    
+    def _parent_has_queue_handler(self) -> bool:
+        """Indique si un logger parent transmet déjà à la file partagée."""
+        parent = self.logger.parent if self.logger.propagate else None
+        while parent is not None:
+            if any(
+                isinstance(handler, logging.handlers.QueueHandler)
+                and handler.queue is PhoneCheckerLogger._queue
+                for handler in parent.handlers
+            ):
+                return True
+            parent = parent.parent if parent.propagate else None
+        return False
+    
+    @classmethod
+    def _start_listener(cls, config, level: int) -> logging.handlers.QueueListener:
+        """Crée les handlers de sortie et démarre le thread d'écriture."""
+        handlers: List[logging.Handler] = []
+        
         # Handler pour la console
         if config.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
@@ -60,102 +270,155 @@ class PhoneCheckerLogger:
             # Formateur avec couleurs pour la console
             console_formatter = ColoredFormatter(config.format)
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # Handler pour les fichiers
         if config.file_path:
-            file_path = Path(config.file_path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
+            handlers.append(cls._create_file_handler(config, level))
+        
+        listener = logging.handlers.QueueListener(
+            cls._queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        # Vide la file avant la sortie du processus
+        atexit.register(listener.stop)
+        return listener
+    
+    @staticmethod
+    def _create_file_handler(config, level: int) -> logging.Handler:
+        """Crée le handler du fichier de log selon la stratégie de rotation."""
+        file_path = Path(config.file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        file_handler: logging.Handler
+        if config.rotation_strategy == 'external':
+            # Rotation assurée par logrotate : le handler rouvre simplement
+            # le fichier quand il a été déplacé
+            file_handler = BufferedWatchedFileHandler(file_path)
+        else:
             # Rotation des logs pour éviter les gros fichiers
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 file_path,
                 maxBytes=10*1024*1024,  # 10MB
                 backupCount=5
             )
-            file_handler.setLevel(level)
-            
-            # Formateur simple pour les fichiers
-            file_formatter = logging.Formatter(config.format)
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
-    
-    def debug(self, message: str, **kwargs):
-        """Log au niveau DEBUG."""
-        self.logger.debug(message, extra=kwargs)
-    
-    def info(self, message: str, **kwargs):
-        """Log au niveau INFO."""
-        self.logger.info(message, extra=kwargs)
-    
-    def warning(self, message: str, **kwargs):
-        """Log au niveau WARNING."""
-        self.logger.warning(message, extra=kwargs)
-    
-    def error(self, message: str, **kwargs):
-        """Log au niveau ERROR."""
-        self.logger.error(message, extra=kwargs)
+        file_handler.setLevel(level)
+        
+        # Formateur simple pour les fichiers
+        file_formatter = CachedTimeFormatter(config.format)
+        file_handler.setFormatter(file_formatter)
+        return file_handler
     
-    def critical(self, message: str, **kwargs):
-        """Log au niveau CRITICAL."""
-        self.logger.critical(message, extra=kwargs)
-    
-    def log_verification_start(self, phone: str, country_code: str, platforms: list):
-        """Log le début d'une vérification."""
-        self.info(
-            f"Début vérification: +{country_code}{phone} sur {', '.join(platforms)}",
-            phone=phone,
-            country_code=country_code,
-            platforms=platforms
+    def log_verification_start(
+        self,
+        phone: str,
+        country_code: str,
+        platforms: list,
+        platforms_csv: Optional[str] = None
+    ):
+        """Log le début d'une vérification.
+        
+        Args:
+            phone: Numéro (anonymisé) vérifié
+            country_code: Indicatif pays
+            platforms: Plateformes demandées
+            platforms_csv: Plateformes déjà jointes par des virgules, si disponibles
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(
+            _FMT_START, country_code, phone,
+            ', '.join(platforms) if platforms_csv is None else platforms_csv,
+            extra={'phone': phone, 'country_code': country_code, 'platforms': platforms},
+            stacklevel=2
         )
     
     def log_verification_result(self, platform: str, phone: str, exists: bool, error: Optional[str] = None):
         """Log le résultat d'une vérification."""
         if error:
-            self.error(
-                f"Erreur vérification {platform}: {error}",
-                platform=platform,
-                phone=phone,
-                error=error
+            if not self.logger.isEnabledFor(logging.ERROR):
+                return
+            self.logger.error(
+                _FMT_ERROR, platform, error,
+                extra={'platform': platform, 'phone': phone, 'error': error},
+                stacklevel=2
             )
         else:
-            status = "trouvé" if exists else "non trouvé"
-            self.info(
-                f"{platform}: {status}",
-                platform=platform,
-                phone=phone,
-                exists=exists
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
+            self.logger.info(
+                _FMT_RESULT, platform, "trouvé" if exists else "non trouvé",
+                extra={'platform': platform, 'phone': phone, 'exists': exists},
+                stacklevel=2
             )
     
     def log_rate_limit(self, platform: str, wait_time: float):
         """Log un délai dû au rate limiting."""
-        self.warning(
-            f"Rate limit {platform}: attente de {wait_time:.1f}s",
-            platform=platform,
-            wait_time=wait_time
+        self.logger.warning(
+            _FMT_RATE_LIMIT, platform, wait_time,
+            extra={'platform': platform, 'wait_time': wait_time},
+            stacklevel=2
         )
     
     def log_cache_hit(self, phone: str, country_code: str, freshness: float):
         """Log un hit de cache."""
-        self.debug(
-            f"Cache hit: +{country_code}{phone} (fraîcheur: {freshness:.2f})",
-            phone=phone,
-            country_code=country_code,
-            freshness=freshness
+        # Appelé à chaque lecture du cache : rien n'est construit hors TRACE
+        if not self.logger.isEnabledFor(TRACE_LEVEL):
+            return
+        self.logger.log(
+            TRACE_LEVEL, _FMT_CACHE_HIT, country_code, phone, freshness,
+            extra={'phone': phone, 'country_code': country_code, 'freshness': freshness},
+            stacklevel=2
         )
     
     def log_cache_miss(self, phone: str, country_code: str):
         """Log un miss de cache."""
-        self.debug(
-            f"Cache miss: +{country_code}{phone}",
-            phone=phone,
-            country_code=country_code
+        if not self.logger.isEnabledFor(TRACE_LEVEL):
+            return
+        self.logger.log(
+            TRACE_LEVEL, _FMT_CACHE_MISS, country_code, phone,
+            extra={'phone': phone, 'country_code': country_code},
+            stacklevel=2
         )
 
+class _LazyLogger:
+    """Proxy d'un PhoneCheckerLogger, créé au premier accès à un attribut.
+    
+    La construction lit la configuration et ouvre éventuellement le fichier
+    de log : un simple import du package n'a pas à la payer. Un attribut
+    résolu est conservé sur le proxy, les accès suivants (logger.info,
+    logger.debug...) ne repassent donc plus par __getattr__.
+    """
+    
+    def __init__(self, name: str = 'phone_checker'):
+        self._name = name
+        self._target: Optional[PhoneCheckerLogger] = None
+    
+    def _resolve(self) -> PhoneCheckerLogger:
+        """Crée le logger réel au premier appel."""
+        if self._target is None:
+            # Le logger du package porte le QueueHandler partagé : il doit
+            # exister avant ses enfants pour que ceux-ci ne s'en ajoutent pas un
+            if self is not logger:
+                logger._resolve()
+            self._target = PhoneCheckerLogger(self._name)
+        return self._target
+    
+    def __getattr__(self, name: str):
+        value = getattr(self._resolve(), name)
+        setattr(self, name, value)
+        return value
+
 # Instance globale du logger
-logger = PhoneCheckerLogger()
+logger = _LazyLogger()
+
+# Loggers spécialisés déjà créés, par nom de module
+_LOGGERS: Dict[str, _LazyLogger] = {}
 
 # Fonction pour obtenir un logger spécialisé
-def get_logger(name: str) -> PhoneCheckerLogger:
-    """Retourne un logger spécialisé pour un module."""
-    return PhoneCheckerLogger(f'phone_checker.{name}')
+def get_logger(name: str) -> _LazyLogger:
+    """Retourne un logger spécialisé pour un module (créé une seule fois)."""
+    specialized = _LOGGERS.get(name)
+    if specialized is None:
+        specialized = _LOGGERS[name] = _LazyLogger(f'phone_checker.{name}')
+    return specialized
@@ -3,11 +3,71 @@
 Ce module définit les structures de données principales utilisées dans l'application.
 """
 
+import json
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from enum import Enum
 
+# Encodage JSON via orjson (extension C) si disponible
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Instances sans __dict__ quand l'interpréteur le permet (Python 3.10+) :
+# un lot de vérifications crée un résultat par numéro et par plateforme
+_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Dernière heure murale lue, indexée par tranche d'environ 1 ms d'horloge monotone
+_NOW_CACHE: List[Any] = [-1, None]
+
+def _now() -> datetime:
+    """Retourne l'heure courante, mise en cache pendant environ une milliseconde.
+    
+    Les résultats d'un même lot sont créés dans la même milliseconde :
+    ils partagent alors le même horodatage au lieu de relire l'horloge murale.
+    """
+    tick = time.monotonic_ns() >> 20
+    if _NOW_CACHE[0] != tick:
+        _NOW_CACHE[0] = tick
+        _NOW_CACHE[1] = datetime.now()
+    return _NOW_CACHE[1]
+
+def encode_json(data: Any, indent: bool = False) -> bytes:
+    """Encode des données en JSON UTF-8.
+    
+    Args:
+        data: Données à encoder (dictionnaires, listes, valeurs simples)
+        indent: True pour une sortie indentée sur deux espaces
+        
+    Returns:
+        Le document JSON encodé en UTF-8
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False
+    ).encode('utf-8')
+
+def decode_json(raw: bytes) -> Any:
+    """Décode un document JSON directement depuis ses octets.
+    
+    orjson lit les octets sans passer par une chaîne intermédiaire ;
+    ses erreurs héritent de json.JSONDecodeError.
+    
+    Args:
+        raw: Document JSON encodé en UTF-8
+        
+    Returns:
+        Les données décodées
+    """
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class VerificationStatus(Enum):
     """Statut de vérification d'un numéro."""
     EXISTS = "exists"
@@ -17,7 +77,10 @@ class VerificationStatus(Enum):
     RATE_LIMITED = "rate_limited"
     UNKNOWN = "unknown"
 
-@dataclass
+# Valeurs texte des statuts, sans passer par le descripteur Enum.value
+_STATUS_VALUES: Dict[VerificationStatus, str] = {s: s.value for s in VerificationStatus}
+
+@dataclass(**_SLOTS)
 class PhoneCheckResult:
     """Résultat de la vérification d'un numéro sur une plateforme spécifique.
     
@@ -41,11 +104,17 @@ class PhoneCheckResult:
     last_seen: Optional[datetime] = None
     confidence_score: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_now)
     response_time: float = 0.0
+    _timestamp_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Initialise les valeurs dérivées après création."""
+        # Un même nom de plateforme est partagé par tous les résultats d'un lot
+        self.platform = sys.intern(self.platform)
+        
         # Assure la cohérence entre status et exists
         if self.status == VerificationStatus.EXISTS:
             self.exists = True
@@ -64,38 +133,47 @@ class PhoneCheckResult:
         """Retourne True si le résultat provient du cache."""
         return self.metadata.get('cached', False)
     
+    def _get_timestamp_iso(self) -> str:
+        """Retourne le timestamp au format ISO, calculé au premier export."""
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not self.timestamp:
+            cached = (self.timestamp, self.timestamp.isoformat())
+            self._timestamp_iso = cached
+        return cached[1]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convertit le résultat en dictionnaire."""
         return {
             'platform': self.platform,
-            'status': self.status.value,
+            'status': _STATUS_VALUES[self.status],
             'exists': self.exists,
             'error': self.error,
             'username': self.username,
             'last_seen': self.last_seen.isoformat() if self.last_seen else None,
             'confidence_score': self.confidence_score,
             'metadata': self.metadata,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self._get_timestamp_iso(),
             'response_time': self.response_time
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PhoneCheckResult':
         """Crée un PhoneCheckResult depuis un dictionnaire."""
+        last_seen = data.get('last_seen')
         return cls(
             platform=data['platform'],
             status=VerificationStatus(data['status']),
             exists=data.get('exists', False),
             error=data.get('error'),
             username=data.get('username'),
-            last_seen=datetime.fromisoformat(data['last_seen']) if data.get('last_seen') else None,
+            last_seen=datetime.fromisoformat(last_seen) if last_seen else None,
             confidence_score=data.get('confidence_score', 0.0),
             metadata=data.get('metadata', {}),
             timestamp=datetime.fromisoformat(data['timestamp']),
             response_time=data.get('response_time', 0.0)
         )
 
-@dataclass
+@dataclass(**_SLOTS)
 class PhoneCheckRequest:
     """Requête de vérification d'un numéro."""
     phone: str
@@ -103,19 +181,27 @@ class PhoneCheckRequest:
     platforms: List[str] = field(default_factory=list)
     force_refresh: bool = False
     max_concurrent_checks: int = 4
+    _platforms_csv: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Valide la requête après création."""
         if not self.platforms:
             from .platforms import DEFAULT_PLATFORMS
-            self.platforms = DEFAULT_PLATFORMS.copy()
+            self.platforms = list(DEFAULT_PLATFORMS)
     
     @property
     def full_number(self) -> str:
         """Retourne le numéro complet avec l'indicatif."""
         return f"+{self.country_code}{self.phone}"
+    
+    @property
+    def platforms_csv(self) -> str:
+        """Plateformes séparées par des virgules (calculé au premier accès)."""
+        if self._platforms_csv is None:
+            self._platforms_csv = ', '.join(self.platforms)
+        return self._platforms_csv
 
-@dataclass
+@dataclass(**_SLOTS)
 class PhoneCheckResponse:
     """Réponse complète d'une vérification."""
     request: PhoneCheckRequest
@@ -123,37 +209,64 @@ class PhoneCheckResponse:
     total_time: float = 0.0
     successful_checks: int = 0
     failed_checks: int = 0
+    _platforms_found: List[str] = field(default_factory=list, init=False, repr=False)
+    _platforms_not_found: List[str] = field(default_factory=list, init=False, repr=False)
+    _platforms_error: List[str] = field(default_factory=list, init=False, repr=False)
+    _success_rate: float = field(default=0.0, init=False, repr=False)
+    _by_platform: Dict[str, PhoneCheckResult] = field(default_factory=dict, init=False, repr=False)
     
     def __post_init__(self):
-        """Calcule les statistiques après création."""
-        self.successful_checks = sum(1 for r in self.results if r.is_successful)
-        self.failed_checks = len(self.results) - self.successful_checks
+        """Calcule les statistiques après création en un seul parcours."""
+        self.invalidate()
+    
+    def invalidate(self):
+        """Recalcule les statistiques, à appeler après modification de results."""
+        found: List[str] = []
+        not_found: List[str] = []
+        errors: List[str] = []
+        by_platform: Dict[str, PhoneCheckResult] = {}
+        for r in self.results:
+            by_platform.setdefault(r.platform, r)
+            if r.exists:
+                found.append(r.platform)
+            if not r.is_successful:
+                errors.append(r.platform)
+            elif not r.exists:
+                not_found.append(r.platform)
+        
+        self._platforms_found = found
+        self._platforms_not_found = not_found
+        self._platforms_error = errors
+        self._by_platform = by_platform
+        self.failed_checks = len(errors)
+        self.successful_checks = len(self.results) - self.failed_checks
+        self._success_rate = (
+            self.successful_checks / len(self.results) if self.results else 0.0
+        )
     
     @property
     def success_rate(self) -> float:
         """Taux de succès des vérifications."""
-        if not self.results:
-            return 0.0
-        return self.successful_checks / len(self.results)
+        return self._success_rate
     
     @property
     def platforms_found(self) -> List[str]:
         """Liste des plateformes où le numéro a été trouvé."""
-        return [r.platform for r in self.results if r.exists]
+        return self._platforms_found
     
     @property
     def platforms_not_found(self) -> List[str]:
         """Liste des plateformes où le numéro n'a pas été trouvé."""
-        return [r.platform for r in self.results if not r.exists and r.is_successful]
+        return self._platforms_not_found
     
     @property
     def platforms_error(self) -> List[str]:
         """Liste des plateformes avec des erreurs."""
-        return [r.platform for r in self.results if not r.is_successful]
+        return self._platforms_error
     
     def get_result_by_platform(self, platform: str) -> Optional[PhoneCheckResult]:
         """Retourne le résultat pour une plateforme spécifique."""
-        return next((r for r in self.results if r.platform == platform), None)
+        return self._by_platform.get(platform)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convertit la réponse en dictionnaire."""
@@ -175,3 +288,7 @@ class PhoneCheckResponse:
                 'platforms_error': self.platforms_error
             }
         }
+    
+    def to_json(self, indent: bool = False) -> bytes:
+        """Convertit la réponse en JSON UTF-8 (via orjson si disponible)."""
+        return encode_json(self.to_dict(), indent=indent)
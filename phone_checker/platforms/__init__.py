@@ -4,25 +4,60 @@ Chaque module dans ce package implémente la logique de vérification
 pour une plateforme spécifique en respectant une interface commune.
 """
 
-from .whatsapp import WhatsAppChecker
-from .telegram import TelegramChecker
-from .instagram import InstagramChecker
-from .snapchat import SnapchatChecker
+import importlib
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
 from .base import BaseChecker
 
-# Mapping des vérificateurs disponibles
-AVAILABLE_CHECKERS = {
-    'whatsapp': WhatsAppChecker,
-    'telegram': TelegramChecker,
-    'instagram': InstagramChecker,
-    'snapchat': SnapchatChecker,
+# Module et classe de chaque vérificateur, importés seulement au premier usage
+_CHECKER_PATHS: Dict[str, Tuple[str, str]] = {
+    'whatsapp': ('.whatsapp', 'WhatsAppChecker'),
+    'telegram': ('.telegram', 'TelegramChecker'),
+    'instagram': ('.instagram', 'InstagramChecker'),
+    'snapchat': ('.snapchat', 'SnapchatChecker'),
 }
 
-# Liste des plateformes activées par défaut
-DEFAULT_PLATFORMS = ['whatsapp', 'telegram', 'instagram', 'snapchat']
+# Nom de classe -> plateforme, pour les imports `from .platforms import XChecker`
+_CLASS_PLATFORMS = {class_name: platform for platform, (_, class_name) in _CHECKER_PATHS.items()}
+
+class _LazyCheckers(Mapping):
+    """Mapping plateforme -> classe de vérificateur, en lecture seule.
+    
+    Le module d'une plateforme n'est importé qu'au premier accès à sa classe.
+    """
+    
+    def __init__(self):
+        self._loaded: Dict[str, type] = {}
+    
+    def __getitem__(self, platform: str) -> type:
+        checker_class = self._loaded.get(platform)
+        if checker_class is None:
+            module_name, class_name = _CHECKER_PATHS[platform]
+            module = importlib.import_module(module_name, __name__)
+            checker_class = self._loaded[platform] = getattr(module, class_name)
+        return checker_class
+    
+    def __contains__(self, platform: object) -> bool:
+        return platform in _CHECKER_PATHS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CHECKER_PATHS)
+    
+    def __len__(self) -> int:
+        return len(_CHECKER_PATHS)
+
+# Mapping des vérificateurs disponibles (lecture seule, import paresseux)
+AVAILABLE_CHECKERS: Mapping[str, type] = _LazyCheckers()
+
+# Ensemble figé utilisé pour les tests d'appartenance
+_AVAILABLE_SET = frozenset(AVAILABLE_CHECKERS)
+
+# Plateformes activées par défaut (partagées, donc immuables)
+DEFAULT_PLATFORMS = ('whatsapp', 'telegram', 'instagram', 'snapchat')
 
-# Configuration des plateformes
-PLATFORM_INFO = {
+# Configuration des plateformes (lecture seule)
+PLATFORM_INFO = MappingProxyType({
     'whatsapp': {
         'name': 'WhatsApp',
         'description': 'Service de messagerie instantanée',
@@ -47,21 +82,44 @@ PLATFORM_INFO = {
         'reliability': 0.7,
         'supports_username': True
     }
-}
+})
+
+# Infos fusionnées des plateformes disponibles, construites au premier appel
+# (elles référencent les classes, donc importent tous les vérificateurs)
+_AVAILABLE_PLATFORMS_TEMPLATE: Optional[Dict[str, Dict[str, Any]]] = None
 
 def get_available_platforms():
-    """Retourne la liste des plateformes disponibles avec leurs infos."""
-    return {
-        platform: {
-            **PLATFORM_INFO.get(platform, {}),
-            'checker_class': checker_class
+    """Retourne la liste des plateformes disponibles avec leurs infos.
+    
+    Chaque appel retourne des dictionnaires neufs, copiés d'un modèle
+    construit une seule fois : l'appelant peut les modifier librement.
+    """
+    global _AVAILABLE_PLATFORMS_TEMPLATE
+    if _AVAILABLE_PLATFORMS_TEMPLATE is None:
+        _AVAILABLE_PLATFORMS_TEMPLATE = {
+            platform: {
+                **PLATFORM_INFO.get(platform, {}),
+                'checker_class': checker_class
+            }
+            for platform, checker_class in AVAILABLE_CHECKERS.items()
         }
-        for platform, checker_class in AVAILABLE_CHECKERS.items()
+    return {
+        platform: dict(info)
+        for platform, info in _AVAILABLE_PLATFORMS_TEMPLATE.items()
     }
 
 def is_platform_available(platform: str) -> bool:
     """Vérifie si une plateforme est disponible."""
-    return platform in AVAILABLE_CHECKERS
+    return platform in _AVAILABLE_SET
+
+def __getattr__(name: str):
+    """Importe à la demande les classes de vérificateurs (PEP 562)."""
+    platform = _CLASS_PLATFORMS.get(name)
+    if platform is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    checker_class = AVAILABLE_CHECKERS[platform]
+    globals()[name] = checker_class
+    return checker_class
 
 __all__ = [
     'AVAILABLE_CHECKERS',
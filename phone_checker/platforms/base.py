@@ -5,15 +5,37 @@ tous les vérificateurs spécifiques aux plateformes.
 """
 
 import time
+import asyncio
+import logging
+import random
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 import httpx
-from datetime import datetime
 
-from ..models import PhoneCheckResult, VerificationStatus
+from ..models import PhoneCheckResult, VerificationStatus, decode_json
 from ..utils import calculate_confidence_score, generate_user_agent, parse_response_error
 from ..logging import get_logger
-from ..config import default_config
+from ..config import get_default_config
+
+# Délai maximal entre deux tentatives d'une requête, en secondes
+_MAX_BACKOFF = 30.0
+
+def _backoff_delay(attempt: int) -> float:
+    """Délai avant la tentative suivante : exponentiel, plafonné, avec gigue.
+    
+    La gigue (jusqu'à 25 % du délai) évite que des workers ayant échoué
+    ensemble ne relancent tous leurs requêtes au même instant.
+    """
+    delay = min(float(1 << attempt), _MAX_BACKOFF)
+    return delay + random.uniform(0, 0.25 * delay)
+
+# Fiabilité de chaque plateforme, utilisée pour le score de confiance
+_PLATFORM_RELIABILITY = {
+    'whatsapp': 0.9,
+    'telegram': 0.85,
+    'instagram': 0.75,
+    'snapchat': 0.7
+}
 
 class BaseChecker(ABC):
     """Classe de base pour tous les vérificateurs de plateformes."""
@@ -22,28 +44,31 @@ class BaseChecker(ABC):
         """Initialise le vérificateur de base.
         
         Args:
-            client: Client HTTP asyncrone optionnel
+            client: Client HTTP asyncrone optionnel, partagé entre les vérificateurs
             platform: Nom de la plateforme
         """
         self.platform = platform
+        # Un client injecté appartient à l'appelant qui se charge de le fermer
+        self._owns_client = client is None
         self.client = client or httpx.AsyncClient()
         self.logger = get_logger(f'platforms.{platform}')
-        self.config = default_config.get_platform_config(platform)
+        self.config = get_default_config().get_platform_config(platform)
         
-        # Configuration du client HTTP
-        self.client.headers.update({
+        # Headers propres au vérificateur, envoyés à chaque requête sans
+        # modifier les headers du client partagé ('Connection' est omis :
+        # httpx garde déjà les connexions ouvertes et HTTP/2 l'interdit)
+        self.headers: Dict[str, str] = {
             'User-Agent': generate_user_agent(),
             'Accept': 'application/json, text/html, */*',
             'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
             'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }
         
         # Headers personnalisés par plateforme
         if self.config.custom_headers:
-            self.client.headers.update(self.config.custom_headers)
+            self.headers.update(self.config.custom_headers)
         
         self.timeout = httpx.Timeout(self.config.timeout)
         
@@ -80,31 +105,36 @@ class BaseChecker(ABC):
             httpx.HTTPError: En cas d'erreur de requête
         """
         kwargs.setdefault('timeout', self.timeout)
+        # Fusion seulement si l'appel précise ses propres headers
+        headers = kwargs.get('headers')
+        kwargs['headers'] = {**self.headers, **headers} if headers else self.headers
         
         for attempt in range(self.config.retry_attempts + 1):
             try:
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 response = await self.client.request(method, url, **kwargs)
-                response_time = (time.time() - start_time) * 1000  # en ms
                 
-                self.logger.debug(
-                    f"Requête {method} {url}: {response.status_code} en {response_time:.1f}ms"
-                )
+                if self.logger.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Requête %s %s: %s en %.1fms",
+                        method, url, response.status_code,
+                        (time.perf_counter_ns() - start_ns) / 1_000_000
+                    )
                 
                 return response
                 
             except httpx.TimeoutException as e:
                 if attempt < self.config.retry_attempts:
-                    wait_time = 2 ** attempt  # Backoff exponentiel
-                    self.logger.warning(f"Timeout, retry dans {wait_time}s (tentative {attempt + 1})")
+                    wait_time = _backoff_delay(attempt)
+                    self.logger.warning(f"Timeout, retry dans {wait_time:.1f}s (tentative {attempt + 1})")
                     await asyncio.sleep(wait_time)
                     continue
                 raise e
                 
             except httpx.RequestError as e:
                 if attempt < self.config.retry_attempts:
-                    wait_time = 2 ** attempt
-                    self.logger.warning(f"Erreur requête, retry dans {wait_time}s: {e}")
+                    wait_time = _backoff_delay(attempt)
+                    self.logger.warning(f"Erreur requête, retry dans {wait_time:.1f}s: {e}")
                     await asyncio.sleep(wait_time)
                     continue
                 raise e
@@ -130,8 +160,7 @@ class BaseChecker(ABC):
             status=status,
             exists=False,
             error=error_message,
-            metadata=metadata or {},
-            timestamp=datetime.now()
+            metadata=metadata or {}
         )
     
     def _create_success_result(
@@ -157,12 +186,7 @@ class BaseChecker(ABC):
         if confidence_score is None:
             # Utilise le status code 200 par défaut pour le calcul
             status_code = metadata.get('status_code', 200) if metadata else 200
-            platform_reliability = {
-                'whatsapp': 0.9,
-                'telegram': 0.85,
-                'instagram': 0.75,
-                'snapchat': 0.7
-            }.get(self.platform, 0.8)
+            platform_reliability = _PLATFORM_RELIABILITY.get(self.platform, 0.8)
             
             confidence_score = calculate_confidence_score(
                 status_code,
@@ -179,7 +203,6 @@ class BaseChecker(ABC):
             username=username,
             confidence_score=confidence_score,
             metadata=metadata or {},
-            timestamp=datetime.now(),
             response_time=response_time
         )
     
@@ -206,14 +229,14 @@ class BaseChecker(ABC):
         # Essaie de parser le JSON si possible
         try:
             if response.headers.get('content-type', '').startswith('application/json'):
-                data = response.json()
+                data = decode_json(response.content)
                 metadata['response_data'] = data
                 return {
                     'success': True,
                     'data': data,
                     'metadata': metadata
                 }
-        except Exception:
+        except ValueError:
             pass
         
         # Sinon utilise le texte
@@ -243,6 +266,18 @@ class BaseChecker(ABC):
             raise ValueError("L'indicatif pays doit être numérique")
     
     async def close(self):
-        """Ferme les ressources du vérificateur."""
-        if hasattr(self.client, 'aclose'):
+        """Ferme les ressources du vérificateur.
+        
+        Seul le client créé par le vérificateur est fermé : un client passé
+        au constructeur reste à la charge de l'appelant.
+        """
+        if self._owns_client:
             await self.client.aclose()
+    
+    async def __aenter__(self):
+        """Support pour les context managers."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Support pour les context managers."""
+        await self.close()
@@ -10,7 +10,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import httpx
 
-from ..models import PhoneCheckResult, VerificationStatus
+from ..models import PhoneCheckResult, VerificationStatus, decode_json
 from ..utils import rate_limit, clean_phone_number, validate_phone_number
 from .base import BaseChecker
 
@@ -21,7 +21,7 @@ class InstagramChecker(BaseChecker):
         super().__init__(client, "instagram")
         
         # Headers spécifiques à Instagram
-        self.client.headers.update({
+        self.headers.update({
             'Referer': 'https://www.instagram.com/',
             'Origin': 'https://www.instagram.com',
             'X-Instagram-AJAX': '1',
@@ -46,7 +46,7 @@ class InstagramChecker(BaseChecker):
             phone: Numéro sans l'indicatif pays
             country_code: Indicatif pays (ex: '33' pour la France)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validation des entrées
@@ -71,7 +71,7 @@ class InstagramChecker(BaseChecker):
             result = await self._check_via_signup_api(full_number)
             
             if result['success']:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 self.logger.log_verification_result(
                     'instagram', full_number, result['exists']
                 )
@@ -85,7 +85,7 @@ class InstagramChecker(BaseChecker):
             
             # Méthode 2: Vérification via reset password (fallback)
             result = await self._check_via_password_reset(full_number)
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             if result['success']:
                 self.logger.log_verification_result(
@@ -105,7 +105,7 @@ class InstagramChecker(BaseChecker):
             )
             
         except httpx.TimeoutException:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Timeout Instagram après {response_time:.1f}ms")
             return self._create_error_result(
                 "Délai d'attente dépassé",
@@ -114,7 +114,7 @@ class InstagramChecker(BaseChecker):
             )
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Erreur inattendue Instagram: {e}")
             return self._create_error_result(
                 str(e),
@@ -133,7 +133,7 @@ class InstagramChecker(BaseChecker):
                 self._csrf_token = self._extract_csrf_token(response)
                 
                 if self._csrf_token:
-                    self.client.headers['X-CSRFToken'] = self._csrf_token
+                    self.headers['X-CSRFToken'] = self._csrf_token
                     self._session_initialized = True
                     self.logger.debug("Session Instagram initialisée avec succès")
                 else:
@@ -206,7 +206,7 @@ class InstagramChecker(BaseChecker):
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     
                     # Si Instagram retourne une erreur pour le numéro de téléphone
                     errors = result.get('errors', {})
@@ -269,7 +269,7 @@ class InstagramChecker(BaseChecker):
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     
                     # Si Instagram trouve le compte
                     if result.get('status') == 'ok':
@@ -323,7 +323,7 @@ class InstagramChecker(BaseChecker):
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     users = result.get('users', [])
                     
                     # Si on trouve des utilisateurs
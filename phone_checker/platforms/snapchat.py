@@ -10,7 +10,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import httpx
 
-from ..models import PhoneCheckResult, VerificationStatus
+from ..models import PhoneCheckResult, VerificationStatus, decode_json
 from ..utils import rate_limit, clean_phone_number, validate_phone_number
 from .base import BaseChecker
 
@@ -21,7 +21,7 @@ class SnapchatChecker(BaseChecker):
         super().__init__(client, "snapchat")
         
         # Headers spécifiques à Snapchat
-        self.client.headers.update({
+        self.headers.update({
             'Referer': 'https://accounts.snapchat.com/',
             'Origin': 'https://accounts.snapchat.com',
             'Sec-Fetch-Site': 'same-origin',
@@ -48,7 +48,7 @@ class SnapchatChecker(BaseChecker):
             phone: Numéro sans l'indicatif pays
             country_code: Indicatif pays (ex: '33' pour la France)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validation des entrées
@@ -73,7 +73,7 @@ class SnapchatChecker(BaseChecker):
             result = await self._check_via_phone_validation(clean_number, country_code)
             
             if result['success']:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 self.logger.log_verification_result(
                     'snapchat', full_number, result['exists']
                 )
@@ -86,7 +86,7 @@ class SnapchatChecker(BaseChecker):
             
             # Méthode 2: Vérification via login (fallback)
             result = await self._check_via_login_attempt(full_number)
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             if result['success']:
                 self.logger.log_verification_result(
@@ -106,7 +106,7 @@ class SnapchatChecker(BaseChecker):
             )
             
         except httpx.TimeoutException:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Timeout Snapchat après {response_time:.1f}ms")
             return self._create_error_result(
                 "Délai d'attente dépassé",
@@ -115,7 +115,7 @@ class SnapchatChecker(BaseChecker):
             )
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Erreur inattendue Snapchat: {e}")
             return self._create_error_result(
                 str(e),
@@ -134,7 +134,7 @@ class SnapchatChecker(BaseChecker):
                 self._xsrf_token = self._extract_xsrf_token(response)
                 
                 if self._xsrf_token:
-                    self.client.headers['X-XSRF-TOKEN'] = self._xsrf_token
+                    self.headers['X-XSRF-TOKEN'] = self._xsrf_token
                     self._session_initialized = True
                     self.logger.debug("Session Snapchat initialisée avec succès")
                 else:
@@ -201,7 +201,7 @@ class SnapchatChecker(BaseChecker):
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     
                     # Snapchat retourne des codes d'erreur spécifiques
                     if 'error' in result:
@@ -285,7 +285,7 @@ class SnapchatChecker(BaseChecker):
             
             if response.status_code in [200, 400, 401]:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     
                     # Si Snapchat retourne une erreur de mot de passe,
                     # cela signifie que le compte existe
@@ -352,7 +352,7 @@ class SnapchatChecker(BaseChecker):
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = decode_json(response.content)
                     
                     # Si le "nom d'utilisateur" (numéro) n'est pas disponible
                     if not result.get('available', True):
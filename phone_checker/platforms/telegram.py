@@ -10,7 +10,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import httpx
 
-from ..models import PhoneCheckResult, VerificationStatus
+from ..models import PhoneCheckResult, VerificationStatus, decode_json
 from ..utils import rate_limit, clean_phone_number, validate_phone_number
 from .base import BaseChecker
 
@@ -21,7 +21,7 @@ class TelegramChecker(BaseChecker):
         super().__init__(client, "telegram")
         
         # Headers spécifiques à Telegram
-        self.client.headers.update({
+        self.headers.update({
             'Referer': 'https://web.telegram.org/',
             'Origin': 'https://web.telegram.org',
             'Sec-Fetch-Site': 'same-site',
@@ -47,7 +47,7 @@ class TelegramChecker(BaseChecker):
         Returns:
             PhoneCheckResult avec les détails de la vérification
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validation des entrées
@@ -68,7 +68,7 @@ class TelegramChecker(BaseChecker):
             result = await self._check_via_login_api(full_number)
             
             if result['success']:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 self.logger.log_verification_result(
                     'telegram', full_number, result['exists']
                 )
@@ -82,7 +82,7 @@ class TelegramChecker(BaseChecker):
             
             # Méthode 2: Vérification via recherche publique (fallback)
             result = await self._check_via_public_search(full_number)
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             if result['success']:
                 self.logger.log_verification_result(
@@ -104,7 +104,7 @@ class TelegramChecker(BaseChecker):
             )
             
         except httpx.TimeoutException:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Timeout Telegram après {response_time:.1f}ms")
             return self._create_error_result(
                 "Délai d'attente dépassé lors de la vérification Telegram",
@@ -113,7 +113,7 @@ class TelegramChecker(BaseChecker):
             )
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Erreur inattendue Telegram: {e}")
             return self._create_error_result(
                 f"Erreur inattendue: {str(e)}",
@@ -150,7 +150,7 @@ class TelegramChecker(BaseChecker):
             
             # Analyse de la réponse
             if response.status_code == 200:
-                result_data = response.json()
+                result_data = decode_json(response.content)
                 
                 # Si Telegram renvoie une erreur "phone number not registered"
                 if 'error' in result_data:
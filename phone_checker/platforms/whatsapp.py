@@ -24,7 +24,7 @@ class WhatsAppChecker(BaseChecker):
         super().__init__(client, "whatsapp")
         
         # Headers spécifiques à WhatsApp
-        self.client.headers.update({
+        self.headers.update({
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
@@ -45,7 +45,7 @@ class WhatsAppChecker(BaseChecker):
         Returns:
             PhoneCheckResult avec les détails de la vérification
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validation des entrées
@@ -68,7 +68,7 @@ class WhatsAppChecker(BaseChecker):
             url = f"https://wa.me/{full_number}"
             
             response = await self._make_request('HEAD', url, follow_redirects=True)
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Analyse la réponse
             exists = self._analyze_whatsapp_response(response)
@@ -92,7 +92,7 @@ class WhatsAppChecker(BaseChecker):
             )
             
         except httpx.TimeoutException:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Timeout WhatsApp après {response_time:.1f}ms")
             return self._create_error_result(
                 "Délai d'attente dépassé lors de la vérification WhatsApp",
@@ -101,7 +101,7 @@ class WhatsAppChecker(BaseChecker):
             )
             
         except httpx.HTTPStatusError as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             error_msg = f"Erreur HTTP {e.response.status_code}"
             self.logger.error(f"Erreur HTTP WhatsApp: {error_msg}")
             
@@ -120,7 +120,7 @@ class WhatsAppChecker(BaseChecker):
             return self._create_error_result(str(e), VerificationStatus.ERROR)
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"Erreur inattendue WhatsApp: {e}")
             return self._create_error_result(
                 f"Erreur inattendue: {str(e)}",
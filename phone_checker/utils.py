@@ -9,13 +9,24 @@ Ce module fournit des fonctions utilitaires pour :
 
 import re
 import time
-from typing import Optional, Dict, List
-from functools import wraps
+from typing import Optional, Dict, List, Any, Awaitable, Callable, Hashable, Tuple
+from functools import lru_cache, wraps
 import asyncio
 from datetime import datetime, timedelta
 import phonenumbers
 from phonenumbers.phonenumberutil import NumberParseException
 
+# Expressions compilées une seule fois au chargement du module
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+_PHONE_DIGITS_PATTERN = re.compile(r'^\d{4,15}$')
+
+# Formats de sortie acceptés par format_phone_number
+_FORMAT_TYPES = {
+    'international': phonenumbers.PhoneNumberFormat.INTERNATIONAL,
+    'national': phonenumbers.PhoneNumberFormat.NATIONAL,
+    'e164': phonenumbers.PhoneNumberFormat.E164
+}
+
 def clean_phone_number(phone: str) -> str:
     """Nettoie un numéro de téléphone en enlevant les caractères non numériques.
     
@@ -25,7 +36,21 @@ def clean_phone_number(phone: str) -> str:
     Returns:
         Numéro nettoyé ne contenant que des chiffres
     """
-    return re.sub(r'\D', '', phone)
+    return _NON_DIGIT_PATTERN.sub('', phone)
+
+def is_plausible_phone_number(phone: str) -> bool:
+    """Vérification rapide du format d'un numéro, sans parsing phonenumbers.
+    
+    Utile pour rejeter un lot de numéros manifestement invalides avant
+    la validation complète par validate_phone_number.
+    
+    Args:
+        phone: Numéro de téléphone sans l'indicatif pays
+        
+    Returns:
+        True si le numéro nettoyé contient entre 4 et 15 chiffres
+    """
+    return _PHONE_DIGITS_PATTERN.match(clean_phone_number(phone)) is not None
 
 def validate_phone_number(phone: str, country_code: str) -> bool:
     """Valide un numéro de téléphone en utilisant la bibliothèque phonenumbers.
@@ -62,25 +87,36 @@ def format_phone_number(phone: str, country_code: str, format_type: str = 'inter
     Returns:
         Numéro formaté ou None si invalide
     """
-    try:
-        clean_number = clean_phone_number(phone)
-        full_number = f"+{country_code}{clean_number}"
-        parsed = phonenumbers.parse(full_number, None)
-        
-        if not phonenumbers.is_valid_number(parsed):
-            return None
-        
-        format_map = {
-            'international': phonenumbers.PhoneNumberFormat.INTERNATIONAL,
-            'national': phonenumbers.PhoneNumberFormat.NATIONAL,
-            'e164': phonenumbers.PhoneNumberFormat.E164
-        }
-        
-        format_enum = format_map.get(format_type, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
-        return phonenumbers.format_number(parsed, format_enum)
+    return parse_and_format(phone, country_code, format_type)[1]
+
+@lru_cache(maxsize=4096)
+def parse_and_format(
+    phone: str,
+    country_code: str,
+    format_type: str = 'international'
+) -> Tuple[bool, Optional[str]]:
+    """Valide et formate un numéro avec un seul parsing phonenumbers.
+    
+    Les résultats sont mémoïsés : un lot contient souvent les mêmes numéros.
+    
+    Args:
+        phone: Numéro de téléphone sans l'indicatif pays
+        country_code: Indicatif pays
+        format_type: Type de formatage ('international', 'national', 'e164')
         
+    Returns:
+        Tuple (numéro valide, numéro formaté ou None si invalide)
+    """
+    try:
+        parsed = phonenumbers.parse(f"+{country_code}{clean_phone_number(phone)}", None)
     except (NumberParseException, ValueError):
-        return None
+        return False, None
+    
+    if not phonenumbers.is_valid_number(parsed):
+        return False, None
+    
+    format_enum = _FORMAT_TYPES.get(format_type, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+    return True, phonenumbers.format_number(parsed, format_enum)
 
 def get_country_code_from_number(phone: str) -> Optional[str]:
     """Extrait l'indicatif pays d'un numéro complet.
@@ -221,6 +257,65 @@ def rate_limit(calls: int, period: int):
         return wrapper
     return decorator
 
+class _Flight:
+    """Travail en cours pour une clé et nombre d'appelants qui l'attendent."""
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """Regroupe les appels concurrents portant sur une même clé.
+    
+    Tant qu'un appel est en cours pour une clé, les appels suivants avec la
+    même clé attendent son résultat au lieu de relancer le travail. Le
+    travail tourne dans une tâche détachée : l'annulation d'un appelant ne
+    touche pas les autres, et la tâche n'est annulée qu'une fois le dernier
+    appelant parti.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Flight] = {}
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Exécute func une seule fois pour tous les appels concurrents sur key.
+        
+        Args:
+            key: Clé identifiant le travail à dédupliquer
+            func: Fonction sans argument retournant la coroutine à exécuter
+            
+        Returns:
+            Résultat de func, partagé par tous les appelants en attente
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda task: self._forget(key, flight))
+        
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Plus personne n'attend le résultat : le travail est abandonné
+                self._forget(key, flight)
+                flight.task.cancel()
+    
+    def _forget(self, key: Hashable, flight: _Flight):
+        """Retire le travail terminé ou abandonné des travaux en cours."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # Marque l'exception comme lue même sans appelant en attente
+        if flight.task.done() and not flight.task.cancelled():
+            flight.task.exception()
+    
+    def __len__(self) -> int:
+        """Nombre de clés en cours de traitement."""
+        return len(self._inflight)
+
 def anonymize_phone_number(phone: str, country_code: str) -> str:
     """Anonymise un numéro pour les logs en gardant les premiers et derniers chiffres.
     
@@ -58,6 +58,43 @@ class TestCacheManager:
         assert cached_data['results'] == test_results
         assert 0.0 <= cached_data['freshness_score'] <= 1.0
     
+    @pytest.mark.asyncio
+    async def test_cache_get_returns_copy(self, cache_manager):
+        """Test de la lecture sans modification de l'entrée stockée."""
+        await cache_manager.set("612345678", "33", {"test": "data"})
+        
+        cached_data = await cache_manager.get("612345678", "33")
+        cached_data['extra'] = True
+        
+        stored = cache_manager.cache_data["33_612345678"].data
+        assert 'freshness_score' not in stored
+        assert 'extra' not in stored
+        assert (await cache_manager.get("612345678", "33")) is not cached_data
+    
+    @pytest.mark.asyncio
+    async def test_cache_debug_logs_lazy(self, cache_manager, monkeypatch, caplog):
+        """Test des messages de debug construits seulement si DEBUG est actif."""
+        import logging
+        from phone_checker.cache import logger as cache_logger
+        
+        sizes = []
+        monkeypatch.setattr(cache_manager, '_format_size', lambda size: sizes.append(size) or "1 B")
+        
+        previous_level = cache_logger.logger.level
+        cache_logger.logger.setLevel(logging.INFO)
+        await cache_manager.set("612345678", "33", {"test": "data"})
+        assert sizes == []
+        
+        cache_logger.logger.setLevel(logging.DEBUG)
+        with caplog.at_level(logging.DEBUG, logger=cache_logger.logger.name):
+            await cache_manager.set("612345678", "33", {"test": "data"})
+            await cache_manager.get("612345678", "33")
+        cache_logger.logger.setLevel(previous_level)
+        
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Entrée mise en cache: 33_612345678 (1 B)" in messages
+        assert any(m.startswith("Cache hit: 33_612345678 (fraîcheur: ") for m in messages)
+    
     @pytest.mark.asyncio
     async def test_cache_miss(self, cache_manager):
         """Test de cache miss."""
@@ -147,6 +184,49 @@ class TestCacheManager:
         finally:
             shutil.rmtree(temp_dir)
     
+    @pytest.mark.asyncio
+    async def test_cache_lru_eviction(self):
+        """Test de l'éviction des entrées les moins récemment utilisées."""
+        temp_dir = tempfile.mkdtemp()
+
+        try:
+            cache = CacheManager(cache_dir=temp_dir, max_size_mb=0.0025)
+            await cache.initialize()
+
+            large_data = {"large_field": "x" * 1000}
+            await cache.set("test1", "1", large_data)
+            await cache.set("test2", "1", large_data)
+
+            # test1 devient la plus récemment utilisée
+            assert await cache.get("test1", "1") is not None
+            await cache.set("test3", "1", large_data)
+
+            assert cache.stats['evictions'] > 0
+            assert await cache.get("test1", "1") is not None
+            assert await cache.get("test2", "1") is None
+
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_cache_mget(self, cache_manager):
+        """Test de la lecture groupée."""
+        await cache_manager.set("612345678", "33", {"test": "data1"})
+        await cache_manager.set("612345679", "33", {"test": "data2"})
+        assert cache_manager.stats['entries_count'] == 2
+        
+        results = await cache_manager.mget([
+            ("612345679", "33"),
+            ("nonexistent", "99"),
+            ("612345678", "33")
+        ])
+        
+        assert results[0]['results'] == {"test": "data2"}
+        assert results[1] is None
+        assert results[2]['results'] == {"test": "data1"}
+        assert cache_manager.stats['hits'] == 2
+        assert cache_manager.stats['misses'] == 1
+    
     @pytest.mark.asyncio
     async def test_cache_stats(self, cache_manager):
         """Test des statistiques du cache."""
@@ -184,5 +264,140 @@ class TestCacheManager:
         assert 'freshness' in entry
         assert 'platforms' in entry
 
+    @pytest.mark.asyncio
+    async def test_cache_persistence(self, cache_manager):
+        """Test du rechargement du cache depuis le journal."""
+        await cache_manager.set("612345678", "33", {"test": "data1"})
+        await cache_manager.set("612345679", "33", {"test": "data2"})
+        await cache_manager.set("612345678", "33", {"test": "data3"})
+        await cache_manager.invalidate("612345679", "33")
+        await cache_manager.flush()
+
+        assert cache_manager.log_path.exists()
+        assert list(cache_manager.cache_dir.glob("*.json")) == []
+
+        reloaded = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await reloaded.initialize()
+
+        assert reloaded.stats['entries_count'] == 1
+        assert reloaded.stats['size_bytes'] == cache_manager.stats['size_bytes']
+        cached_data = await reloaded.get("612345678", "33")
+        assert cached_data['results'] == {"test": "data3"}
+        assert await reloaded.get("612345679", "33") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_lazy_decoding(self, cache_manager):
+        """Test du décodage des entrées au premier accès après rechargement."""
+        await cache_manager.set("612345678", "33", {"test": "data"})
+        await cache_manager.flush()
+
+        reloaded = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await reloaded.initialize()
+
+        entry = reloaded.cache_data["33_612345678"]
+        assert entry.blob is not None
+        assert entry.timestamp == cache_manager.cache_data["33_612345678"].timestamp
+
+        cached_data = await reloaded.get("612345678", "33")
+        assert cached_data['results'] == {"test": "data"}
+        assert entry.blob is None
+
+    @pytest.mark.asyncio
+    async def test_cache_compressed_records(self, cache_manager):
+        """Test de la compression des enregistrements volumineux sur disque."""
+        large_results = {"large_field": "x" * 5000}
+        await cache_manager.set("612345678", "33", large_results)
+        await cache_manager.flush()
+
+        # Le budget est compté sur les données brutes, le journal est compressé
+        assert cache_manager.stats['size_bytes'] > 5000
+        assert cache_manager.log_path.stat().st_size < 1000
+
+        reloaded = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await reloaded.initialize()
+        cached_data = await reloaded.get("612345678", "33")
+        assert cached_data['results'] == large_results
+        assert reloaded.stats['size_bytes'] == cache_manager.stats['size_bytes']
+
+    @pytest.mark.asyncio
+    async def test_cache_write_behind(self, cache_manager):
+        """Test de l'écriture différée des entrées dans le journal."""
+        await cache_manager.set("612345678", "33", {"test": "data"})
+
+        # L'entrée est disponible immédiatement mais pas encore écrite
+        assert await cache_manager.get("612345678", "33") is not None
+        assert not cache_manager.log_path.exists()
+
+        await cache_manager.close()
+        assert cache_manager.log_path.stat().st_size > 0
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_between_processes(self, cache_manager, monkeypatch):
+        """Test de la compaction quand un autre processus écrit dans le journal."""
+        import phone_checker.cache as cache_module
+        monkeypatch.setattr(cache_module, '_COMPACTION_MIN_BYTES', 0)
+
+        other = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await other.initialize()
+
+        await cache_manager.set("612345678", "33", {"test": "data"})
+        await cache_manager.flush()
+        await other.set("612345679", "33", {"test": "other"})
+        await other.flush()
+
+        # La compaction ne doit pas effacer l'écriture de l'autre gestionnaire
+        await cache_manager.invalidate("612345678", "33")
+        await cache_manager.flush()
+
+        reloaded = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await reloaded.initialize()
+        assert await reloaded.get("612345679", "33") is not None
+        assert await reloaded.get("612345678", "33") is None
+
+        # Nouvelles compactions de part et d'autre : aucune écriture perdue
+        for i in range(3):
+            await cache_manager.set("612345670", "33", {"test": i})
+            await cache_manager.flush()
+        for i in range(3):
+            await other.set("612345671", "33", {"test": i})
+            await other.flush()
+        await cache_manager.set("612345672", "33", {"test": "data"})
+        await cache_manager.flush()
+
+        reloaded = CacheManager(cache_dir=str(cache_manager.cache_dir), expire_after=3600)
+        await reloaded.initialize()
+        assert (await reloaded.get("612345679", "33"))['results'] == {"test": "other"}
+        assert (await reloaded.get("612345670", "33"))['results'] == {"test": 2}
+        assert (await reloaded.get("612345671", "33"))['results'] == {"test": 2}
+        assert await reloaded.get("612345672", "33") is not None
+        assert await reloaded.get("612345678", "33") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_legacy_files_migration(self):
+        """Test de la migration des anciens fichiers JSON vers le journal."""
+        import json
+        temp_dir = tempfile.mkdtemp()
+
+        try:
+            legacy_data = {
+                'timestamp': datetime.now().isoformat(),
+                'results': {"test": "legacy"},
+                'phone': "612345678",
+                'country_code': "33"
+            }
+            with open(Path(temp_dir) / "33_612345678.json", 'w', encoding='utf-8') as f:
+                json.dump(legacy_data, f)
+
+            cache = CacheManager(cache_dir=temp_dir, expire_after=3600)
+            await cache.initialize()
+
+            assert cache.stats['entries_count'] == 1
+            assert list(Path(temp_dir).glob("*.json")) == []
+            cached_data = await cache.get("612345678", "33")
+            assert cached_data['results'] == {"test": "legacy"}
+
+        finally:
+            shutil.rmtree(temp_dir)
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,171 @@
+"""Tests pour la commande batch de l'interface en ligne de commande."""
+
+import asyncio
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from phone_checker import __main__ as cli_module
+from phone_checker.__main__ import cli, iter_batch_numbers
+from phone_checker.models import (
+    PhoneCheckRequest, PhoneCheckResponse, PhoneCheckResult, VerificationStatus
+)
+
+class FakePhoneChecker:
+    """PhoneChecker sans réseau ni cache, qui enregistre les appels."""
+    
+    calls = []
+    
+    def __init__(self, platforms=None, **kwargs):
+        self.platforms = platforms
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def check_number(self, phone, country_code, platforms=None):
+        self.calls.append((phone, country_code))
+        await asyncio.sleep(0)
+        if phone == 'erreur':
+            raise RuntimeError("échec de vérification")
+        request = PhoneCheckRequest(phone=phone, country_code=country_code)
+        return PhoneCheckResponse(
+            request=request,
+            results=[PhoneCheckResult(platform='mock', status=VerificationStatus.EXISTS, exists=True)]
+        )
+
+@pytest.fixture
+def fake_checker(monkeypatch):
+    """Remplace PhoneChecker dans le CLI par FakePhoneChecker."""
+    FakePhoneChecker.calls = []
+    monkeypatch.setattr(cli_module, 'PhoneChecker', FakePhoneChecker)
+    return FakePhoneChecker
+
+def run_batch(tmp_path, name, content, *args):
+    """Écrit le fichier de lot puis lance la commande batch."""
+    batch_file = tmp_path / name
+    if isinstance(content, bytes):
+        batch_file.write_bytes(content)
+    else:
+        batch_file.write_text(content, encoding='utf-8')
+    return CliRunner().invoke(cli, ['batch', str(batch_file), *args])
+
+class TestIterBatchNumbers:
+    """Tests pour la lecture des fichiers de lot."""
+    
+    def test_text_file(self):
+        """Test d'un fichier texte avec lignes vides."""
+        f = io.StringIO("612345678\n\n  698765432  \n")
+        assert list(iter_batch_numbers(f, False, '33')) == [
+            {'phone': '612345678', 'country_code': '33'},
+            {'phone': '698765432', 'country_code': '33'},
+        ]
+    
+    def test_csv_country_fallback(self):
+        """Test de l'indicatif par défaut quand la colonne est vide ou absente."""
+        f = io.StringIO("phone,country_code\n612345678,44\n698765432,\n,33\n")
+        assert list(iter_batch_numbers(f, True, '33')) == [
+            {'phone': '612345678', 'country_code': '44'},
+            {'phone': '698765432', 'country_code': '33'},
+        ]
+        
+        f = io.StringIO("phone\n612345678\n")
+        assert list(iter_batch_numbers(f, True, '49')) == [
+            {'phone': '612345678', 'country_code': '49'},
+        ]
+
+class TestBatchCommand:
+    """Tests pour la commande batch avec un vérificateur simulé."""
+    
+    def test_json_output(self, fake_checker, tmp_path):
+        """Test de la sortie JSON complète et du comptage des doublons."""
+        output = tmp_path / 'results.json'
+        result = run_batch(
+            tmp_path, 'numbers.txt', "612345678\n06 12 34 56 78\n612345678\n698765432\n",
+            '--country', '33', '--concurrent', '1', '--output', str(output)
+        )
+        
+        assert result.exit_code == 0, result.output
+        data = json.loads(output.read_text(encoding='utf-8'))
+        assert data['total_numbers'] == 4
+        assert data['successful_checks'] == 4
+        assert data['duplicate_rows'] == 1
+        assert len(data['results']) == 4
+        # "06 12 34 56 78" se nettoie en un numéro différent de "612345678"
+        assert fake_checker.calls == [
+            ('612345678', '33'), ('06 12 34 56 78', '33'), ('698765432', '33')
+        ]
+    
+    def test_jsonl_output(self, fake_checker, tmp_path):
+        """Test de l'écriture au fil de l'eau, une ligne JSON par numéro."""
+        output = tmp_path / 'results.jsonl'
+        result = run_batch(
+            tmp_path, 'numbers.txt', "612345678\n698765432\n612345678\n",
+            '--concurrent', '1', '--output', str(output)
+        )
+        
+        assert result.exit_code == 0, result.output
+        lines = output.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 3
+        records = [json.loads(line) for line in lines]
+        assert [r['request']['phone'] for r in records] == ['612345678', '698765432', '612345678']
+        assert len(fake_checker.calls) == 2
+        assert "3/3 résultats écrits" in result.output
+    
+    def test_memo_eviction(self, fake_checker, tmp_path, monkeypatch):
+        """Test de la nouvelle vérification d'un doublon sorti de la mémoire."""
+        monkeypatch.setattr(cli_module, 'BATCH_MEMO_SIZE', 1)
+        output = tmp_path / 'results.json'
+        result = run_batch(
+            tmp_path, 'numbers.txt', "612345678\n698765432\n698765432\n612345678\n",
+            '--concurrent', '1', '--output', str(output)
+        )
+        
+        assert result.exit_code == 0, result.output
+        data = json.loads(output.read_text(encoding='utf-8'))
+        assert data['duplicate_rows'] == 1
+        assert fake_checker.calls == [
+            ('612345678', '33'), ('698765432', '33'), ('612345678', '33')
+        ]
+    
+    def test_csv_country_code(self, fake_checker, tmp_path):
+        """Test de l'indicatif par défaut pour les lignes CSV sans indicatif."""
+        output = tmp_path / 'results.json'
+        result = run_batch(
+            tmp_path, 'numbers.csv', "phone,country_code\n612345678,44\n612345678,\n",
+            '--country', '33', '--concurrent', '1', '--output', str(output)
+        )
+        
+        assert result.exit_code == 0, result.output
+        # Même numéro, indicatifs différents : pas de doublon
+        data = json.loads(output.read_text(encoding='utf-8'))
+        assert data['duplicate_rows'] == 0
+        assert fake_checker.calls == [('612345678', '44'), ('612345678', '33')]
+    
+    def test_concurrent_workers(self, fake_checker, tmp_path):
+        """Test du pipeline file d'attente / workers sur plus de numéros que la file."""
+        numbers = [f"6{i:08d}" for i in range(50)]
+        output = tmp_path / 'results.jsonl'
+        result = run_batch(
+            tmp_path, 'numbers.txt', "\n".join(numbers + ['erreur']) + "\n",
+            '--concurrent', '4', '--output', str(output)
+        )
+        
+        assert result.exit_code == 0, result.output
+        phones = [json.loads(line)['request']['phone']
+                  for line in output.read_text(encoding='utf-8').splitlines()]
+        # Les échecs de vérification sont ignorés sans arrêter le lot
+        assert sorted(phones) == numbers
+        assert len(fake_checker.calls) == 51
+        assert "50/51 résultats écrits" in result.output
+    
+    def test_read_error(self, fake_checker, tmp_path):
+        """Test de l'arrêt avec un code d'erreur sur un fichier illisible."""
+        result = run_batch(tmp_path, 'numbers.txt', b"612345678\n\xff\xfe\n", '--concurrent', '2')
+        
+        assert result.exit_code == 1
+        assert "Erreur lors de la lecture du fichier" in result.output
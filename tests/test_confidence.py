@@ -0,0 +1,51 @@
+"""Tests pour le système de score de confiance."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from phone_checker.confidence import ConfidenceScorer
+
+class TestConfidenceScorer:
+    """Tests pour le calculateur de scores de confiance."""
+    
+    def test_update_refreshes_platform_score(self):
+        """Test du recalcul du score après une mise à jour de fiabilité."""
+        scorer = ConfidenceScorer()
+        before = scorer.get_confidence_score('whatsapp', 200, 0.3)
+        
+        scorer.update_platform_reliability('whatsapp', success=False, response_time=6.0)
+        
+        assert scorer.platform_scores['whatsapp'].api_timeouts == 1
+        assert scorer.get_confidence_score('whatsapp', 200, 0.3) < before
+    
+    def test_batch_matches_single_scores(self):
+        """Test de l'équivalence entre le calcul par lot et le calcul unitaire."""
+        scorer = ConfidenceScorer()
+        cached_at = datetime.now() - timedelta(hours=6)
+        
+        platforms = ['whatsapp', 'telegram', 'unknown', 'snapchat']
+        status_codes = [200, 429, 404, 202]
+        response_times = [0.2, 3.0, 7.5, 1.0]
+        cache_timestamps = [None, cached_at, None, cached_at]
+        
+        batch = scorer.get_confidence_scores_batch(
+            platforms, status_codes, response_times, cache_timestamps
+        )
+        single = [
+            scorer.get_confidence_score(*args)
+            for args in zip(platforms, status_codes, response_times, cache_timestamps)
+        ]
+        
+        assert batch == single
+    
+    def test_batch_length_mismatch(self):
+        """Test du rejet de séquences de longueurs différentes."""
+        scorer = ConfidenceScorer()
+        
+        with pytest.raises(ValueError):
+            scorer.get_confidence_scores_batch(['whatsapp', 'telegram'], [200], [0.2, 0.3])
+        with pytest.raises(ValueError):
+            scorer.get_confidence_scores_batch(['whatsapp'], [200], [0.2], [None, None])
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,96 @@
+"""Tests pour la configuration."""
+
+import pytest
+
+from phone_checker import config as config_module
+from phone_checker.config import Config, get_default_config
+
+class TestConfig:
+    """Tests pour le gestionnaire de configuration."""
+    
+    def test_env_overrides(self, monkeypatch, tmp_path):
+        """Test de l'application des variables d'environnement."""
+        monkeypatch.setenv('PHONE_CHECKER_CACHE_ENABLED', 'false')
+        monkeypatch.setenv('PHONE_CHECKER_CACHE_DIR', '/tmp/phone-cache')
+        monkeypatch.setenv('PHONE_CHECKER_LOG_LEVEL', 'DEBUG')
+        monkeypatch.setenv('PHONE_CHECKER_LOG_ROTATION', 'external')
+        
+        config = Config(config_file=str(tmp_path / 'missing.json'))
+        
+        assert config.cache.enabled is False
+        assert config.cache.directory == '/tmp/phone-cache'
+        assert config.logging.level == 'DEBUG'
+        assert config.logging.file_path is None
+        assert config.logging.rotation_strategy == 'external'
+    
+    def test_env_read_per_config(self, monkeypatch, tmp_path):
+        """Test de la relecture de l'environnement à chaque configuration."""
+        config_file = str(tmp_path / 'missing.json')
+        monkeypatch.setenv('PHONE_CHECKER_LOG_LEVEL', 'DEBUG')
+        assert Config(config_file=config_file).logging.level == 'DEBUG'
+        
+        monkeypatch.setenv('PHONE_CHECKER_LOG_LEVEL', 'ERROR')
+        assert Config(config_file=config_file).logging.level == 'ERROR'
+    
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test de la sauvegarde puis du rechargement de la configuration."""
+        config_file = str(tmp_path / 'config' / 'settings.json')
+        config = Config(config_file=config_file)
+        config.cache.expire_after = 7200
+        config.logging.file_path = 'logs/vérification.log'
+        config.logging.rotation_strategy = 'external'
+        config.platforms['telegram'].enabled = False
+        config.save_config()
+        
+        reloaded = Config(config_file=config_file)
+        assert reloaded.cache.expire_after == 7200
+        assert reloaded.logging.file_path == 'logs/vérification.log'
+        assert reloaded.logging.rotation_strategy == 'external'
+        assert reloaded.platforms['telegram'].enabled is False
+    
+    def test_save_after_directory_removed(self, tmp_path):
+        """Test de la sauvegarde après suppression du répertoire de destination."""
+        import shutil
+        config_file = tmp_path / 'config' / 'settings.json'
+        config = Config(config_file=str(config_file))
+        config.save_config()
+        
+        shutil.rmtree(tmp_path / 'config')
+        config.save_config()
+        assert config_file.exists()
+    
+    def test_save_in_current_directory(self, monkeypatch, tmp_path):
+        """Test de la sauvegarde sans répertoire parent dans le chemin."""
+        monkeypatch.chdir(tmp_path)
+        config = Config(config_file='settings.json')
+        config.save_config()
+        
+        assert (tmp_path / 'settings.json').exists()
+    
+    def test_platform_config_lookup(self, tmp_path):
+        """Test de la configuration des plateformes connues et inconnues."""
+        config = Config(config_file=str(tmp_path / 'missing.json'))
+        
+        assert config.get_platform_config('telegram') is config.platforms['telegram']
+        unknown = config.get_platform_config('unknown')
+        assert unknown.enabled is True
+        assert unknown.custom_headers == {}
+        
+        # La configuration par défaut n'est pas partagée entre appels
+        unknown.enabled = False
+        unknown.custom_headers['X-Test'] = '1'
+        other = config.get_platform_config('other')
+        assert other is not unknown
+        assert other.enabled is True
+        assert other.custom_headers == {}
+    
+    def test_default_config_is_lazy(self, monkeypatch):
+        """Test de la création de la configuration globale au premier accès."""
+        monkeypatch.setattr(config_module, '_default_config', None)
+        
+        config = get_default_config()
+        assert get_default_config() is config
+        assert config_module.default_config is config
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from phone_checker import PhoneChecker
 from phone_checker.models import VerificationStatus
+from phone_checker.config import PlatformConfig
 from phone_checker.platforms.base import BaseChecker
 
 class MockChecker(BaseChecker):
@@ -187,6 +188,7 @@ class TestIntegrationPhoneChecker:
         assert final_stats['total_checks'] == 6  # 2 numéros × 3 plateformes
         assert final_stats['successful_checks'] == 4  # 2 numéros × 2 plateformes réussies
         assert final_stats['failed_checks'] == 2  # 2 numéros × 1 plateforme échouée
+        assert final_stats['cache_hit_rate'] == mock_phone_checker.cache_hit_rate
     
     @pytest.mark.asyncio
     async def test_health_check(self, mock_phone_checker):
@@ -238,6 +240,160 @@ class TestIntegrationPhoneChecker:
         # Le checker devrait être fermé automatiquement
         # (pas de moyen facile de tester cela avec les mocks actuels)
 
+    @pytest.mark.asyncio
+    async def test_shared_client(self):
+        """Test du partage du client HTTP entre les vérificateurs."""
+        checker = PhoneChecker(platforms=['whatsapp', 'telegram'], use_cache=False)
+
+        assert checker.session is checker.client
+        for platform_checker in checker.checkers.values():
+            assert platform_checker.client is checker.session
+
+        # Fermer un vérificateur ne doit pas fermer le client partagé
+        await checker.checkers['whatsapp'].close()
+        assert not checker.session.is_closed
+
+        await checker.close()
+        assert checker.session.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_after_cache_error(self, monkeypatch, temp_cache_dir):
+        """Test de la fermeture du client même si le cache échoue."""
+        checker = PhoneChecker(platforms=['whatsapp'], use_cache=True)
+        checker.cache.cache_dir = Path(temp_cache_dir)
+        
+        async def failing_close():
+            raise OSError("disque plein")
+        
+        monkeypatch.setattr(checker.cache, 'close', failing_close)
+        await checker.close()
+        assert checker.client.is_closed
+
+    def test_available_platforms_are_copies(self):
+        """Test du retour de dictionnaires neufs par get_available_platforms."""
+        from phone_checker.platforms import get_available_platforms
+        
+        platforms = get_available_platforms()
+        assert type(platforms) is dict
+        assert type(platforms['whatsapp']) is dict
+        
+        platforms['whatsapp']['name'] = 'modifié'
+        del platforms['telegram']
+        assert get_available_platforms()['whatsapp']['name'] == 'WhatsApp'
+        assert 'telegram' in get_available_platforms()
+
+    @pytest.mark.asyncio
+    async def test_cached_results_metadata(self, mock_phone_checker):
+        """Test du marquage des résultats en cache sans altérer l'entrée."""
+        platforms = ['mock_success', 'mock_failure']
+        for platform in platforms:
+            mock_phone_checker.checkers[platform].platform = platform
+        await mock_phone_checker.check_number("612345678", "33", platforms=platforms)
+        
+        response = await mock_phone_checker.check_number("612345678", "33", platforms=platforms)
+        
+        assert len(response.results) == 2
+        assert all(r.is_cached for r in response.results)
+        
+        cached_data = await mock_phone_checker.cache.get("612345678", "33")
+        for result_data in cached_data['results'].values():
+            assert 'cached' not in result_data['metadata']
+
+    @pytest.mark.asyncio
+    async def test_iter_multiple_numbers(self, mock_phone_checker):
+        """Test de la production des réponses au fil de l'eau."""
+        numbers = [
+            {"phone": "612345678", "country_code": "33"},
+            {"phone": "invalid", "country_code": "33"},
+            {"phone": "612345679", "country_code": "33"}
+        ]
+        
+        received = {}
+        async for index, response in mock_phone_checker.iter_multiple_numbers(numbers):
+            received[index] = response
+        
+        assert sorted(received) == [0, 1, 2]
+        assert isinstance(received[1], ValueError)
+        assert received[0].request.phone == "612345678"
+        assert received[2].request.phone == "612345679"
+    
+    @pytest.mark.asyncio
+    async def test_multiple_numbers_batched_cache(self, mock_phone_checker):
+        """Test de la lecture et de l'écriture groupées du cache par lot."""
+        numbers = [
+            {"phone": "612345678", "country_code": "33"},
+            {"phone": "612345679", "country_code": "33"}
+        ]
+        for platform, checker in mock_phone_checker.checkers.items():
+            checker.platform = platform
+        
+        first = await mock_phone_checker.check_multiple_numbers(numbers)
+        assert mock_phone_checker.cache.stats['entries_count'] == 2
+        
+        second = await mock_phone_checker.check_multiple_numbers(numbers)
+        assert len(first) == len(second) == 2
+        assert mock_phone_checker.stats['cache_hits'] == 2
+        assert mock_phone_checker.checkers['mock_success'].call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_iter_multiple_numbers_early_exit(self, mock_phone_checker):
+        """Test de l'abandon du lot après la première réponse."""
+        class SlowChecker(MockChecker):
+            def __init__(self):
+                super().__init__(should_exist=True)
+                self.platform = "slow"
+                self.cancelled = []
+            
+            async def check(self, phone, country_code):
+                if phone != "612345678":
+                    try:
+                        await asyncio.sleep(0.2)
+                    except asyncio.CancelledError:
+                        self.cancelled.append(phone)
+                        raise
+                return await super().check(phone, country_code)
+        
+        slow = SlowChecker()
+        mock_phone_checker.checkers = {"slow": slow}
+        numbers = [
+            {"phone": "612345678", "country_code": "33"},
+            {"phone": "612345679", "country_code": "33"},
+            {"phone": "612345670", "country_code": "33"}
+        ]
+        
+        batch = mock_phone_checker.iter_multiple_numbers(numbers)
+        index, _ = await batch.__anext__()
+        
+        # Un autre appel rejoint la vérification en cours du deuxième numéro
+        other = asyncio.ensure_future(mock_phone_checker.check_number("612345679", "33"))
+        await asyncio.sleep(0.05)
+        await batch.aclose()
+        
+        assert index == 0
+        assert slow.cancelled == ["612345670"]
+        assert (await other).results[0].exists
+        assert await mock_phone_checker.cache.get("612345678", "33") is not None
+        assert await mock_phone_checker.cache.get("612345679", "33") is not None
+        assert await mock_phone_checker.cache.get("612345670", "33") is None
+    
+    @pytest.mark.asyncio
+    async def test_multiple_numbers_repeated_number(self, mock_phone_checker):
+        """Test de la réutilisation du cache pour un numéro répété dans le lot."""
+        numbers = [
+            {"phone": "612345678", "country_code": "33"},
+            {"phone": "612345679", "country_code": "33"},
+            {"phone": "612345678", "country_code": "33"}
+        ]
+        for platform, checker in mock_phone_checker.checkers.items():
+            checker.platform = platform
+        
+        responses = await mock_phone_checker.check_multiple_numbers(numbers, max_concurrent=1)
+        
+        # Le premier résultat est en cache avant que la répétition ne soit traitée
+        assert mock_phone_checker.checkers['mock_success'].call_count == 2
+        assert all(r.is_cached for r in responses[2].results)
+        assert mock_phone_checker.cache.stats['entries_count'] == 2
+
 class TestIntegrationErrorHandling:
     """Tests d'intégration pour la gestion d'erreurs."""
     
@@ -271,6 +427,123 @@ class TestIntegrationErrorHandling:
         assert timeout_result.status == VerificationStatus.TIMEOUT
         assert timeout_result.error == "Timeout"
 
+    @pytest.mark.asyncio
+    async def test_checker_exception_handling(self, mock_phone_checker):
+        """Test de la conversion des exceptions des vérificateurs en résultats."""
+        class RaisingChecker(BaseChecker):
+            async def check(self, phone, country_code):
+                raise RuntimeError("Boom")
+        
+        mock_phone_checker.checkers['raising'] = RaisingChecker()
+        platforms = ['mock_success', 'raising', 'missing']
+        
+        results = await mock_phone_checker._perform_checks("612345678", "33", platforms)
+        
+        assert [r.platform for r in results[1:]] == ['raising', 'missing']
+        assert results[0].status == VerificationStatus.EXISTS
+        assert results[1].status == VerificationStatus.ERROR
+        assert results[1].error == "Boom"
+        assert results[2].status == VerificationStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_request_retry_backoff(self, monkeypatch):
+        """Test des nouvelles tentatives avec délai plafonné et gigue."""
+        import httpx
+        import phone_checker.platforms.base as base_module
+        
+        attempts = []
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200)
+        
+        delays = []
+        async def fake_sleep(delay):
+            delays.append(delay)
+        monkeypatch.setattr(base_module.asyncio, 'sleep', fake_sleep)
+        
+        class RetryChecker(BaseChecker):
+            async def check(self, phone, country_code):
+                pass
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            checker = RetryChecker(client, "retry")
+            checker.config = PlatformConfig(retry_attempts=3)
+            response = await checker._make_request('GET', 'https://example.invalid/')
+        
+        assert response.status_code == 200
+        assert len(attempts) == 3
+        assert 1.0 <= delays[0] <= 1.25
+        assert 2.0 <= delays[1] <= 2.5
+        assert base_module._backoff_delay(10) <= base_module._MAX_BACKOFF * 1.25
+
+    @pytest.mark.asyncio
+    async def test_checker_client_ownership(self):
+        """Test de la fermeture du client selon son propriétaire."""
+        import httpx
+        
+        async with httpx.AsyncClient() as client:
+            async with MockChecker(client) as checker:
+                pass
+            # Le client injecté reste ouvert pour l'appelant
+            assert not checker.client.is_closed
+        
+        async with MockChecker() as checker:
+            pass
+        assert checker.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_checker_headers_per_request(self):
+        """Test des headers envoyés par requête sans modifier le client partagé."""
+        import httpx
+        
+        requests = []
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            client_headers = dict(client.headers)
+            first = MockChecker(client)
+            second = MockChecker(client)
+            second.headers['X-Token'] = 'second'
+            
+            await first._make_request('GET', 'https://example.invalid/')
+            await second._make_request('GET', 'https://example.invalid/', headers={'X-Extra': '1'})
+        
+        assert dict(client.headers) == client_headers
+        assert requests[0].headers['User-Agent'] == first.headers['User-Agent']
+        assert 'X-Token' not in requests[0].headers
+        assert requests[1].headers['X-Token'] == 'second'
+        assert requests[1].headers['X-Extra'] == '1'
+        assert 'X-Extra' not in second.headers
+
+    @pytest.mark.asyncio
+    async def test_connection_warmup(self):
+        """Test du préchauffage des connexions à l'ouverture."""
+        import httpx
+        
+        requests = []
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+        
+        # Désactivé par défaut
+        async with PhoneChecker(platforms=['whatsapp'], use_cache=False) as idle:
+            assert idle._warmup_tasks == []
+        
+        checker = PhoneChecker(platforms=['whatsapp'], use_cache=False, warmup_connections=True)
+        await checker.client.aclose()
+        checker.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        async with checker:
+            await asyncio.gather(*checker._warmup_tasks)
+        
+        assert [(r.method, r.url.host) for r in requests] == [('HEAD', 'wa.me')]
+        assert requests[0].headers['User-Agent'] == checker.checkers['whatsapp'].headers['User-Agent']
+        assert checker._warmup_tasks == []
+
 class TestIntegrationConcurrency:
     """Tests d'intégration pour la concurrence."""
     
@@ -322,6 +595,33 @@ class TestIntegrationConcurrency:
         assert len(rate_checker.call_times) == 3
         
         # (Le rate limiting est géré au niveau des plateformes individuelles)
+    
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self, mock_phone_checker):
+        """Test de la limite de concurrence commune à tous les appels."""
+        class SlowChecker(BaseChecker):
+            active = 0
+            max_active = 0
+            
+            async def check(self, phone, country_code):
+                SlowChecker.active += 1
+                SlowChecker.max_active = max(SlowChecker.max_active, SlowChecker.active)
+                await asyncio.sleep(0.01)
+                SlowChecker.active -= 1
+                return self._create_success_result(exists=True, response_time=10.0)
+        
+        mock_phone_checker.checkers = {
+            'slow_a': SlowChecker(None, 'slow_a'),
+            'slow_b': SlowChecker(None, 'slow_b')
+        }
+        mock_phone_checker.max_concurrent_checks = 2
+        
+        await asyncio.gather(*[
+            mock_phone_checker.check_number(f"61234567{i}", "33", force_refresh=True)
+            for i in range(4)
+        ])
+        
+        assert SlowChecker.max_active == 2
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""Tests pour le système de logging."""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from phone_checker.config import LoggingConfig
+from phone_checker.logging import (
+    BufferedRotatingFileHandler, BufferedWatchedFileHandler, CachedTimeFormatter, ColoredFormatter,
+    TRACE_LEVEL, PhoneCheckerLogger, get_logger, logger
+)
+
+class TestPhoneCheckerLogger:
+    """Tests pour le gestionnaire de logging."""
+    
+    def test_records_go_through_queue(self):
+        """Test du passage des enregistrements par la file partagée."""
+        handlers = logger.logger.handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+        assert handlers[0].queue is PhoneCheckerLogger._queue
+        assert PhoneCheckerLogger._listener is not None
+        
+        # Les loggers enfants passent par le handler du parent (pas de doublon)
+        assert get_logger('tests.queue').logger.handlers == []
+    
+    def test_get_logger_memoized(self):
+        """Test de la réutilisation des loggers spécialisés."""
+        assert get_logger('tests.memo') is get_logger('tests.memo')
+        assert get_logger('tests.memo') is not get_logger('tests.other')
+    
+    def test_logger_created_lazily(self):
+        """Test de la création du logger au premier usage seulement."""
+        lazy = get_logger('tests.lazy')
+        assert lazy._target is None
+        
+        lazy.debug("premier usage")
+        assert lazy._target is not None
+        assert lazy.logger is logging.getLogger('phone_checker.tests.lazy')
+    
+    def test_cache_logs_at_trace_level(self, monkeypatch):
+        """Test de l'absence de construction des messages hors TRACE."""
+        test_logger = get_logger('tests.cache_logs')
+        calls = []
+        monkeypatch.setattr(
+            test_logger.logger, 'log',
+            lambda level, message, *args, **kwargs: calls.append((level, message % args))
+        )
+        
+        test_logger.logger.setLevel(logging.DEBUG)
+        test_logger.log_cache_hit('612345678', '33', 0.5)
+        test_logger.log_cache_miss('612345678', '33')
+        assert calls == []
+        
+        test_logger.logger.setLevel(TRACE_LEVEL)
+        test_logger.log_cache_miss('612345678', '33')
+        assert calls == [(TRACE_LEVEL, 'Cache miss: +33612345678')]
+        assert logging.getLevelName(TRACE_LEVEL) == 'TRACE'
+    
+    def test_caller_location(self, caplog):
+        """Test de l'attribution des enregistrements à l'appelant."""
+        test_logger = get_logger('tests.caller')
+        with caplog.at_level(logging.INFO, logger=test_logger.logger.name):
+            test_logger.info("direct")
+            test_logger.log_rate_limit('whatsapp', 1.5)
+            test_logger.info("champs", user='a')
+            test_logger.info("arguments %s", 'b')
+        
+        assert [r.funcName for r in caplog.records] == ['test_caller_location'] * 4
+        assert caplog.records[2].user == 'a'
+        assert caplog.records[3].getMessage() == "arguments b"
+        assert caplog.records[1].wait_time == 1.5
+        assert caplog.records[1].getMessage() == "Rate limit whatsapp: attente de 1.5s"
+    
+    @pytest.mark.parametrize('strategy, handler_class', [
+        ('size', BufferedRotatingFileHandler),
+        ('external', BufferedWatchedFileHandler)
+    ])
+    def test_file_handler_rotation_strategy(self, tmp_path, strategy, handler_class):
+        """Test du choix du handler de fichier selon la stratégie de rotation."""
+        config = LoggingConfig(
+            file_path=str(tmp_path / 'logs' / 'app.log'),
+            rotation_strategy=strategy
+        )
+        handler = PhoneCheckerLogger._create_file_handler(config, logging.INFO)
+        try:
+            assert type(handler) is handler_class
+            assert handler.level == logging.INFO
+        finally:
+            handler.close()
+    
+    def test_cached_time_formatter(self):
+        """Test de l'équivalence avec le formateur standard."""
+        fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        cached = CachedTimeFormatter(fmt)
+        standard = logging.Formatter(fmt)
+        
+        for created in (1700000000.125, 1700000000.5, 1700000001.0):
+            record = logging.LogRecord('tests', logging.INFO, __file__, 1, 'msg %s', ('x',), None)
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            assert cached.format(record) == standard.format(record)
+    
+    def test_colored_formatter_restores_levelname(self):
+        """Test de la restauration du niveau après formatage coloré."""
+        formatter = ColoredFormatter('%(levelname)s - %(message)s')
+        record = logging.LogRecord('tests', logging.WARNING, __file__, 1, 'msg', None, None)
+        
+        assert formatter.format(record) == '\033[33mWARNING\033[0m - msg'
+        assert record.levelname == 'WARNING'
+
+class TestBufferedRotatingFileHandler:
+    """Tests pour le handler de fichier bufferisé."""
+    
+    @pytest.fixture
+    def file_logger(self, tmp_path):
+        """Fixture pour un logger isolé écrivant dans un fichier temporaire."""
+        handler = BufferedRotatingFileHandler(
+            tmp_path / 'test.log', maxBytes=200, backupCount=2
+        )
+        test_logger = logging.getLogger('tests.buffered_file')
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        yield test_logger
+        test_logger.removeHandler(handler)
+        handler.close()
+    
+    def test_flush_on_warning(self, file_logger, tmp_path):
+        """Test du vidage du tampon seulement à partir de WARNING."""
+        log_file = tmp_path / 'test.log'
+        
+        file_logger.info("info")
+        assert log_file.stat().st_size == 0
+        
+        file_logger.warning("warning")
+        assert log_file.read_text() == "info\nwarning\n"
+    
+    def test_rollover(self, file_logger, tmp_path):
+        """Test de la rotation malgré l'écriture bufferisée."""
+        for _ in range(30):
+            file_logger.info("x" * 20)
+        file_logger.handlers[0].flush()
+        
+        assert (tmp_path / 'test.log.1').exists()
+        assert (tmp_path / 'test.log.2').exists()
+        assert (tmp_path / 'test.log').stat().st_size < 200
+    
+    def test_rollover_counts_bytes(self, tmp_path):
+        """Test de la rotation selon la taille encodée des messages accentués."""
+        handler = BufferedRotatingFileHandler(
+            tmp_path / 'accents.log', maxBytes=200, backupCount=5, encoding='utf-8'
+        )
+        record = logging.LogRecord('tests', logging.INFO, __file__, 0, "é" * 20, None, None)
+        for _ in range(10):
+            handler.emit(record)
+        handler.close()
+        
+        for log_file in tmp_path.glob('accents.log*'):
+            assert log_file.stat().st_size <= 200
+
+class TestBufferedWatchedFileHandler:
+    """Tests pour le handler bufferisé à rotation externe."""
+    
+    def test_buffering_and_reopen(self, tmp_path):
+        """Test du vidage sur WARNING et de la réouverture après déplacement."""
+        log_file = tmp_path / 'app.log'
+        handler = BufferedWatchedFileHandler(log_file)
+        handler.check_interval = 3600
+        handler.flush()
+        
+        def record(level, msg):
+            return logging.LogRecord('tests', level, __file__, 0, msg, None, None)
+        
+        try:
+            handler.emit(record(logging.INFO, "info"))
+            assert log_file.stat().st_size == 0
+            
+            handler.emit(record(logging.WARNING, "warning"))
+            assert log_file.read_text() == "info\nwarning\n"
+            
+            # Déplacement par logrotate : les lignes en tampon vont à l'ancien
+            # fichier, les suivantes au nouveau
+            log_file.rename(tmp_path / 'app.log.1')
+            handler.emit(record(logging.INFO, "avant"))
+            handler.emit(record(logging.ERROR, "après"))
+            handler.emit(record(logging.ERROR, "nouveau"))
+        finally:
+            handler.close()
+        
+        assert (tmp_path / 'app.log.1').read_text().startswith("info\nwarning\n")
+        assert log_file.read_text().endswith("nouveau\n")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -6,7 +6,8 @@ from phone_checker.models import (
     PhoneCheckResult,
     PhoneCheckRequest,
     PhoneCheckResponse,
-    VerificationStatus
+    VerificationStatus,
+    decode_json
 )
 
 class TestPhoneCheckResult:
@@ -126,7 +127,15 @@ class TestPhoneCheckResult:
         assert data['metadata'] == {"test": "value"}
         assert data['timestamp'] == timestamp.isoformat()
         assert data['response_time'] == 150.5
-    
+
+    def test_phone_check_result_timestamp_iso_cache(self):
+        """Test du cache ISO du timestamp après réaffectation."""
+        result = PhoneCheckResult(platform="whatsapp", status=VerificationStatus.EXISTS)
+        assert result.to_dict()['timestamp'] == result.timestamp.isoformat()
+
+        result.timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        assert result.to_dict()['timestamp'] == "2024-01-01T12:00:00"
+
     def test_phone_check_result_from_dict(self):
         """Test de création depuis un dictionnaire."""
         timestamp = datetime.now()
@@ -171,6 +180,7 @@ class TestPhoneCheckRequest:
         assert request.force_refresh == True
         assert request.max_concurrent_checks == 2
         assert request.full_number == "+33612345678"
+        assert request.platforms_csv == "whatsapp, telegram"
     
     def test_phone_check_request_default_platforms(self):
         """Test des plateformes par défaut."""
@@ -183,6 +193,11 @@ class TestPhoneCheckRequest:
         assert len(request.platforms) > 0
         assert "whatsapp" in request.platforms
 
+        # La liste de la requête est indépendante des constantes partagées
+        from phone_checker.platforms import DEFAULT_PLATFORMS
+        request.platforms.append("custom")
+        assert "custom" not in DEFAULT_PLATFORMS
+
 class TestPhoneCheckResponse:
     """Tests pour PhoneCheckResponse."""
     
@@ -258,6 +273,35 @@ class TestPhoneCheckResponse:
         assert response.platforms_not_found == ["telegram"]
         assert response.platforms_error == ["instagram"]
     
+    def test_phone_check_response_invalidate(self):
+        """Test du recalcul des statistiques après modification des résultats."""
+        request = PhoneCheckRequest(
+            phone="612345678",
+            country_code="33"
+        )
+        
+        response = PhoneCheckResponse(
+            request=request,
+            results=[
+                PhoneCheckResult(
+                    platform="whatsapp",
+                    status=VerificationStatus.EXISTS,
+                    exists=True
+                )
+            ]
+        )
+        assert response.success_rate == 1.0
+        
+        response.results.append(PhoneCheckResult(
+            platform="telegram",
+            status=VerificationStatus.TIMEOUT
+        ))
+        response.invalidate()
+        
+        assert response.failed_checks == 1
+        assert response.success_rate == 0.5
+        assert response.platforms_error == ["telegram"]
+    
     def test_phone_check_response_get_result_by_platform(self):
         """Test de récupération de résultat par plateforme."""
         request = PhoneCheckRequest(
@@ -319,5 +363,22 @@ class TestPhoneCheckResponse:
         assert data['summary']['successful_checks'] == 1
         assert data['summary']['failed_checks'] == 0
 
+    def test_phone_check_response_to_json(self):
+        """Test de l'encodage JSON de la réponse."""
+        import json
+        request = PhoneCheckRequest(phone="612345678", country_code="33", platforms=["whatsapp"])
+        result = PhoneCheckResult(platform="whatsapp", status=VerificationStatus.EXISTS)
+        response = PhoneCheckResponse(request=request, results=[result])
+        
+        assert json.loads(response.to_json()) == response.to_dict()
+        assert json.loads(response.to_json(indent=True)) == response.to_dict()
+        assert decode_json(response.to_json()) == response.to_dict()
+
+    def test_decode_json_invalid(self):
+        """Test de l'erreur levée pour un document JSON invalide."""
+        import json
+        with pytest.raises(json.JSONDecodeError):
+            decode_json(b"{invalid")
+
 if __name__ == "__main__":
     pytest.main([__file__])
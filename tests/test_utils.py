@@ -5,8 +5,10 @@ from phone_checker.utils import (
     clean_phone_number,
     validate_phone_number,
     format_phone_number,
+    parse_and_format,
     get_country_code_from_number,
     is_mobile_number,
+    is_plausible_phone_number,
     anonymize_phone_number,
     calculate_confidence_score
 )
@@ -62,12 +64,32 @@ class TestPhoneNumberUtils:
         result = format_phone_number("invalid", "33", "international")
         assert result is None
     
+    def test_parse_and_format(self):
+        """Test de la validation et du formatage combinés."""
+        valid, formatted = parse_and_format("6 12 34 56 78", "33")
+        assert valid == True
+        assert formatted == format_phone_number("612345678", "33", "international")
+        
+        assert parse_and_format("612345678", "33", "e164") == (True, "+33612345678")
+        assert parse_and_format("123", "33") == (False, None)
+        assert parse_and_format("invalid", "33") == (False, None)
+    
     def test_get_country_code_from_number(self):
         """Test d'extraction du code pays."""
         assert get_country_code_from_number("+33612345678") == "33"
         assert get_country_code_from_number("+15551234567") == "1"
         assert get_country_code_from_number("invalid") is None
     
+    def test_is_plausible_phone_number(self):
+        """Test de la vérification rapide du format."""
+        assert is_plausible_phone_number("612345678") == True
+        assert is_plausible_phone_number("06 12 34 56 78") == True
+        
+        assert is_plausible_phone_number("") == False
+        assert is_plausible_phone_number("123") == False
+        assert is_plausible_phone_number("invalid") == False
+        assert is_plausible_phone_number("1" * 16) == False
+    
     def test_is_mobile_number(self):
         """Test de détection des mobiles."""
         # Mobile français
@@ -152,5 +174,104 @@ class TestRateLimiter:
         # Le troisième appel doit être décalé d'au moins 0.5s
         assert call_times[2] - call_times[1] >= 0.5
 
+class TestSingleFlight:
+    """Tests pour la déduplication des appels concurrents."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test du partage d'un même appel entre appelants concurrents."""
+        import asyncio
+        from phone_checker.utils import SingleFlight
+        
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+        
+        results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(5)])
+        
+        assert len(calls) == 1
+        assert all(result == {"ok": True} for result in results)
+        assert len(flight) == 0
+        
+        # Une fois terminé, un nouvel appel relance le travail
+        await flight.do("key", fetch)
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self):
+        """Test de la propagation d'une erreur à tous les appelants."""
+        import asyncio
+        from phone_checker.utils import SingleFlight
+        
+        flight = SingleFlight()
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream")
+        
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(flight) == 0
+    
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_spares_followers(self):
+        """Test de l'annulation du premier appelant sans effet sur les suivants."""
+        import asyncio
+        from phone_checker.utils import SingleFlight
+        
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+        
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        
+        leader.cancel()
+        assert await follower == {"ok": True}
+        assert leader.cancelled()
+        assert len(calls) == 1
+        assert len(flight) == 0
+    
+    @pytest.mark.asyncio
+    async def test_work_cancelled_without_waiters(self):
+        """Test de l'abandon du travail quand tous les appelants sont annulés."""
+        import asyncio
+        from phone_checker.utils import SingleFlight
+        
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = []
+        
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+        
+        caller = asyncio.ensure_future(flight.do("key", fetch))
+        await started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        
+        assert cancelled == [1]
+        assert len(flight) == 0
+
 if __name__ == "__main__":
     pytest.main([__file__])